@@ -5,21 +5,41 @@ Useful for re-processing papers where abstract extraction failed during scraping
 
 Usage:
     poetry run python extract_abstracts_from_html.py --all
+    poetry run python extract_abstracts_from_html.py --all --reprocess
     poetry run python extract_abstracts_from_html.py --missing-only
     poetry run python extract_abstracts_from_html.py --limit 10
 """
 
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
 
+from cite_hustle.collectors.ssrn_html import extract_abstract_from_html
 from cite_hustle.config import settings
 from cite_hustle.database.models import DatabaseManager
 from cite_hustle.database.repository import ArticleRepository
 
+# Resolved once instead of running os.path.expandvars for every stored path
+HOME = os.environ.get('HOME', '$HOME')
+
+# Default number of extracted abstracts written to the database per statement
+DEFAULT_BATCH_SIZE = 500
+
+# Rows pulled from DuckDB per fetch while streaming the papers to process
+FETCH_BATCH_ROWS = 1024
+
+# Saved pages smaller than this cannot contain an abstract (error/stub pages)
+MIN_HTML_BYTES = 2048
+
+# SSRN paper pages are a few hundred KB; anything this large is not one
+MAX_HTML_BYTES = 5_000_000
+
+# HTML files handed to each worker process at a time
+PARSE_CHUNKSIZE = 32
+
 
 def expand_portable_path(path_str: str) -> Path:
     """
@@ -32,113 +52,36 @@ def expand_portable_path(path_str: str) -> Path:
         Path object with expanded absolute path
     """
     if path_str and path_str.startswith('$HOME/'):
-        expanded = os.path.expandvars(path_str)
-        return Path(expanded)
+        return Path(HOME + path_str[len('$HOME'):])
     return Path(path_str) if path_str else None
 
 
-def extract_abstract_from_html(html_content: str) -> Optional[str]:
-    """
-    Extract abstract from SSRN HTML using multiple strategies with BeautifulSoup
-    
-    Args:
-        html_content: HTML content of SSRN paper page
-        
-    Returns:
-        Abstract text or None if not found
-    """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    strategies = [
-        # Strategy 1: div.abstract-text with paragraphs
-        lambda: extract_by_class(soup, "abstract-text"),
-        # Strategy 2: Find Abstract h3, get parent, extract paragraphs
-        lambda: extract_after_header(soup, "Abstract"),
-        # Strategy 3: Any div with class containing "abstract"
-        lambda: extract_by_class_partial(soup, "abstract"),
-        # Strategy 4: Find "Abstract" text, get next siblings
-        lambda: extract_by_text_search(soup, "Abstract"),
-    ]
-    
-    for strategy in strategies:
-        try:
-            abstract = strategy()
-            if abstract and len(abstract.strip()) > 50:  # Minimum reasonable length
-                # Clean up the abstract
-                abstract = abstract.strip()
-                # Remove "Abstract" header if it's at the start
-                if abstract.startswith("Abstract"):
-                    abstract = abstract[8:].strip()
-                return abstract
-        except Exception as e:
-            # Strategy failed, try next one
-            continue
-    
-    return None
-
-
-def extract_by_class(soup: BeautifulSoup, class_name: str) -> Optional[str]:
-    """Extract abstract from element with specific class"""
-    div = soup.find('div', class_=class_name)
-    if div:
-        # Try to get paragraphs
-        paragraphs = div.find_all('p')
-        if paragraphs:
-            text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-            return text if text else None
-        # Otherwise get all text
-        return div.get_text(strip=True)
-    return None
-
-
-def extract_after_header(soup: BeautifulSoup, header_text: str) -> Optional[str]:
-    """Find header with text, then extract following paragraphs"""
-    # Find all h3 tags
-    for h3 in soup.find_all('h3'):
-        if header_text.lower() in h3.get_text().lower():
-            # Get parent element
-            parent = h3.parent
-            if parent:
-                paragraphs = parent.find_all('p')
-                if paragraphs:
-                    text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
-                    return text if text else None
-    return None
-
-
-def extract_by_class_partial(soup: BeautifulSoup, partial_class: str) -> Optional[str]:
-    """Find div with class containing partial match"""
-    for div in soup.find_all('div'):
-        if div.get('class'):
-            classes = ' '.join(div.get('class'))
-            if partial_class.lower() in classes.lower():
-                text = div.get_text(strip=True)
-                # Remove "Abstract" header
-                text = text.replace('Abstract\n', '').replace('Abstract', '').strip()
-                return text if len(text) > 50 else None
-    return None
+def scan_html_sizes(html_dir: Path) -> Dict[str, int]:
+    """Map filename -> size for every file in the HTML directory, in one scandir pass"""
+    sizes = {}
+    try:
+        with os.scandir(html_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    sizes[entry.name] = entry.stat().st_size
+    except FileNotFoundError:
+        pass
+    return sizes
 
 
-def extract_by_text_search(soup: BeautifulSoup, search_text: str) -> Optional[str]:
-    """Search for text and extract following content"""
-    # Find all elements containing "Abstract"
-    for elem in soup.find_all(string=lambda text: text and search_text in text):
-        parent = elem.parent
-        if parent:
-            # Get all following siblings
-            paragraphs = []
-            for sibling in parent.find_next_siblings():
-                if sibling.name == 'p':
-                    paragraphs.append(sibling.get_text(strip=True))
-                elif sibling.name in ['h1', 'h2', 'h3', 'h4']:
-                    # Stop at next header
-                    break
-            
-            if paragraphs:
-                text = " ".join(paragraphs)
-                return text if text else None
+def file_size(path: Path, html_dir: Path, html_sizes: Dict[str, int]) -> Optional[int]:
+    """
+    Size of a saved HTML file, or None if it does not exist.
     
-    return None
+    Files in html_dir are looked up in the pre-scanned sizes; anything stored
+    elsewhere falls back to a stat() call.
+    """
+    if path.parent == html_dir:
+        return html_sizes.get(path.name)
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
 
 
 def process_html_file(filepath: Path) -> Optional[str]:
@@ -167,8 +110,14 @@ def main():
     parser = argparse.ArgumentParser(description='Extract abstracts from saved SSRN HTML files')
     parser.add_argument('--all', action='store_true', help='Process all HTML files')
     parser.add_argument('--missing-only', action='store_true', help='Only process papers with missing abstracts')
+    parser.add_argument('--reprocess', action='store_true',
+                        help='With --all, also re-extract papers that already have an abstract')
     parser.add_argument('--limit', type=int, help='Limit number of papers to process')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without updating database')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Abstracts written per database update (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Worker processes used to parse HTML files (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -181,6 +130,7 @@ def main():
     print("=" * 80)
     
     # Get papers to process
+    already_had = 0
     if args.missing_only:
         # Only papers with HTML but no abstract
         query = """
@@ -189,88 +139,128 @@ def main():
             WHERE html_file_path IS NOT NULL 
             AND (abstract IS NULL OR abstract = '')
         """
-        if args.limit:
-            query += f" LIMIT {args.limit}"
-        
-        papers = db.conn.execute(query).fetchdf()
-        print(f"Found {len(papers)} papers with missing abstracts")
+        found_label = "papers with missing abstracts"
     
     elif args.all:
-        # All papers with HTML
+        # All papers with HTML. Those that already have an abstract are filtered
+        # out in SQL, so their files are never read, unless --reprocess is set.
         query = """
-            SELECT doi, html_file_path, abstract
+            SELECT doi, html_file_path
             FROM ssrn_pages 
             WHERE html_file_path IS NOT NULL
         """
-        if args.limit:
-            query += f" LIMIT {args.limit}"
-        
-        papers = db.conn.execute(query).fetchdf()
-        print(f"Found {len(papers)} papers with saved HTML")
+        if not args.reprocess:
+            already_had = db.conn.execute("""
+                SELECT COUNT(*)
+                FROM ssrn_pages
+                WHERE html_file_path IS NOT NULL
+                AND abstract IS NOT NULL AND abstract <> ''
+            """).fetchone()[0]
+            query += " AND (abstract IS NULL OR abstract = '')"
+        found_label = "papers with saved HTML"
     
     else:
         print("Error: Specify --all or --missing-only")
         return
+
+    if args.limit:
+        query += f" LIMIT {args.limit}"
+
+    # One directory read instead of a stat() per paper (slow on Dropbox)
+    html_dir = settings.html_storage_dir
+    html_sizes = scan_html_sizes(html_dir)
+
+    # Stream rows in batches rather than materializing a DataFrame, and resolve
+    # which files to parse before fanning out to worker processes
+    total = 0
+    file_not_found = 0
+    too_small = 0
+    too_large = 0
+    jobs: List[Tuple[str, Path]] = []
+    cursor = db.conn.execute(query)
+    while rows := cursor.fetchmany(FETCH_BATCH_ROWS):
+        for doi, html_path in rows:
+            total += 1
+
+            # Check if file exists (expand portable paths like $HOME)
+            html_file_path = expand_portable_path(html_path)
+            size = file_size(html_file_path, html_dir, html_sizes) if html_path else None
+            if size is None:
+                file_not_found += 1
+                print(f"\n✗ {doi}: HTML file not found at {html_path}")
+                continue
+            if size < MIN_HTML_BYTES:
+                too_small += 1
+                continue
+            if size > MAX_HTML_BYTES:
+                too_large += 1
+                continue
+
+            jobs.append((doi, html_file_path))
+
+    print(f"Found {total} {found_label}")
+    if too_small:
+        print(f"Skipping {too_small} HTML files under {MIN_HTML_BYTES} bytes")
+    if too_large:
+        print(f"Skipping {too_large} HTML files over {MAX_HTML_BYTES} bytes")
+    if already_had:
+        print(f"Skipping {already_had} papers that already have an abstract (use --reprocess)")
     
-    if len(papers) == 0:
+    if total == 0:
         print("No papers to process!")
         return
     
     # Process each paper
     stats = {
-        'total': len(papers),
+        'total': total,
         'success': 0,
-        'already_had': 0,
-        'failed': 0,
-        'file_not_found': 0
+        'already_had': already_had,
+        'failed': too_small + too_large,
+        'file_not_found': file_not_found
     }
     
     print("\nProcessing papers...")
     print("-" * 80)
-    
-    for idx, row in tqdm(papers.iterrows(), total=len(papers), desc="Extracting abstracts"):
-        doi = row['doi']
-        html_path = row.get('html_file_path')
-        existing_abstract = row.get('abstract', '')
-        
-        # Check if file exists (expand portable paths like $HOME)
-        html_file_path = expand_portable_path(html_path)
-        if not html_path or not html_file_path or not html_file_path.exists():
-            stats['file_not_found'] += 1
-            print(f"\n✗ {doi}: HTML file not found at {html_path}")
-            continue
-        
-        # Skip if already has abstract (unless --all)
-        if existing_abstract and args.missing_only:
-            stats['already_had'] += 1
-            continue
-        
-        # Extract abstract
-        abstract = process_html_file(html_file_path)
-        
-        if abstract:
-            stats['success'] += 1
-            
-            if args.dry_run:
-                print(f"\n✓ {doi}: Would update abstract ({len(abstract)} chars)")
-                print(f"  Preview: {abstract[:150]}...")
+
+    # Extracted abstracts are written in batches, one set-based UPDATE per batch
+    pending_updates: List[Tuple[str, str]] = []
+
+    def flush_updates():
+        if not pending_updates:
+            return
+        try:
+            repo.bulk_update_abstracts(pending_updates)
+        except Exception as e:
+            tqdm.write(f"✗ Database error writing {len(pending_updates)} abstracts: {e}")
+            stats['failed'] += len(pending_updates)
+            stats['success'] -= len(pending_updates)
+        pending_updates.clear()
+
+    # Parsing is CPU-bound and independent per file, so spread it across processes;
+    # results come back in order and are written from this process only.
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        abstracts = executor.map(
+            process_html_file, [path for _, path in jobs], chunksize=PARSE_CHUNKSIZE
+        )
+        for (doi, _), abstract in tqdm(
+            zip(jobs, abstracts), total=len(jobs), desc="Extracting abstracts"
+        ):
+            if abstract:
+                stats['success'] += 1
+                
+                if args.dry_run:
+                    print(f"\n✓ {doi}: Would update abstract ({len(abstract)} chars)")
+                    print(f"  Preview: {abstract[:150]}...")
+                else:
+                    pending_updates.append((doi, abstract))
+                    tqdm.write(f"✓ {doi}: Extracted abstract ({len(abstract)} chars)")
+                    if len(pending_updates) >= args.batch_size:
+                        flush_updates()
             else:
-                # Update database
-                try:
-                    db.conn.execute("""
-                        UPDATE ssrn_pages 
-                        SET abstract = ? 
-                        WHERE doi = ?
-                    """, [abstract, doi])
-                    
-                    tqdm.write(f"✓ {doi}: Updated abstract ({len(abstract)} chars)")
-                except Exception as e:
-                    print(f"\n✗ {doi}: Database error: {e}")
-                    stats['failed'] += 1
-                    stats['success'] -= 1
-        else:
-            stats['failed'] += 1
-            tqdm.write(f"✗ {doi}: Could not extract abstract")
+                stats['failed'] += 1
+                tqdm.write(f"✗ {doi}: Could not extract abstract")
+
+    flush_updates()
     
     # Print summary
     print("\n" + "=" * 80)
@@ -0,0 +1,76 @@
+"""
+Clean HTML tags and entities out of stored article titles
+
+Titles collected before MetadataCollector.clean_title existed may still
+contain markup such as <i>...</i> or &amp;. This script registers
+clean_title as a DuckDB function and fixes every affected row with a
+single UPDATE, so titles never round-trip through Python row by row.
+
+Run: poetry run python scripts/clean_titles.py
+"""
+from cite_hustle.collectors.metadata import MetadataCollector
+from cite_hustle.config import settings
+from cite_hustle.database.models import DatabaseManager
+
+
+# The LIKE prefilter keeps markup-free rows from ever reaching the Python function
+NEEDS_CLEANING = (
+    "(title LIKE '%<%' OR title LIKE '%&%') AND clean_title(title) IS DISTINCT FROM title"
+)
+
+
+def clean_titles():
+    """Rewrite titles containing HTML markup in one statement"""
+
+    print("="*60)
+    print("CLEANING ARTICLE TITLES")
+    print("="*60)
+
+    # Connect to database
+    print(f"\nConnecting to: {settings.db_path}")
+    db = DatabaseManager(settings.db_path)
+    db.connect()
+    db.conn.create_function(
+        "clean_title", MetadataCollector.clean_title, ["VARCHAR"], "VARCHAR"
+    )
+
+    samples = db.conn.execute(f"""
+        SELECT title, clean_title(title) AS cleaned
+        FROM articles
+        WHERE {NEEDS_CLEANING}
+        LIMIT 10
+    """).fetchall()
+
+    if not samples:
+        print("\n✓ No titles with HTML markup found!")
+        db.close()
+        return
+
+    print("\nExamples:\n")
+    for title, cleaned in samples:
+        print(f"  - {title[:80]}")
+        print(f"    → {cleaned[:80]}")
+
+    updated = db.conn.execute(f"""
+        UPDATE articles
+        SET title = clean_title(title), updated_at = now()
+        WHERE {NEEDS_CLEANING}
+    """).fetchone()[0]
+
+    print(f"\n✓ Cleaned {updated:,} titles")
+
+    if updated:
+        # Rebuild FTS indexes so search sees the cleaned titles
+        print("\nRebuilding search indexes...")
+        try:
+            db.create_fts_indexes(abstracts=False)
+            print("✓ Search indexes rebuilt")
+        except Exception as e:
+            print(f"⚠️  Warning: Failed to rebuild indexes: {e}")
+            print("   Run: poetry run cite-hustle rebuild-fts")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    clean_titles()
@@ -1,29 +1,38 @@
 """Cleanup SSRN HTML files that are Cloudflare "are you human" pages (default ~20,800 bytes).
 
 This script:
-- Removes HTML artifacts in ``$HOME/Dropbox/Github Data/cite-hustle/ssrn_html`` that match a target size (default around 20,800 bytes with tolerance)
+- Removes HTML artifacts in the configured ``ssrn_html`` directory (by default ``$HOME/Dropbox/Github Data/cite-hustle/ssrn_html``) that match a target size (default around 20,800 bytes with tolerance)
 - Deletes matching rows from DuckDB table ``ssrn_pages`` so the DOIs will be scraped again
 - Prints a summary and uses portable ``$HOME``-prefixed paths for logging
 
 Usage::
 
-    poetry run python scripts/cleanup_bad_ssrn_html.py [--size-bytes 20833] [--tolerance-bytes 500]
+    poetry run python scripts/cleanup_bad_ssrn_html.py [--size-bytes 20833] [--tolerance-bytes 500] [--verbose]
 """
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import pandas as pd
+
+from cite_hustle.config import settings
 from cite_hustle.database.models import DatabaseManager
+
 HOME = Path.home()
-BASE_DIR = HOME / "Dropbox" / "Github Data" / "cite-hustle"
-HTML_DIR = BASE_DIR / "ssrn_html"
-DB_PATH = BASE_DIR / "DB" / "articles.duckdb"
+# Same locations as the CLI, so CITE_HUSTLE_DROPBOX_BASE is honored here too
+HTML_DIR = settings.html_storage_dir
+DB_PATH = settings.db_path
 
 # Default size for Cloudflare "are you human" pages (around 20,800-20,900 bytes)
 DEFAULT_SIZE_BYTES = 20833
 DEFAULT_TOLERANCE_BYTES = 500
 
+# stat() is latency-bound on a cold directory; overlap the syscalls
+STAT_WORKERS = 16
+
 
 def to_portable(path: Path) -> str:
     """Return a `$HOME`-prefixed string for logging or DB storage."""
@@ -44,23 +53,54 @@ def portable_to_absolute(portable_path: Optional[str]) -> Optional[Path]:
     return Path(portable_path)
 
 
-def find_files_by_size(directory: Path, target_size: int, tolerance: int) -> List[Path]:
+def _file_size(path: str) -> Optional[int]:
+    try:
+        return os.stat(path, follow_symlinks=False).st_size
+    except FileNotFoundError:
+        return None
+
+
+def scan_html_sizes(directory: Path) -> Dict[Path, int]:
+    """Return the size of every HTML file in directory.
+
+    Names are filtered from the directory listing first; the stat() calls,
+    which dominate on a cold or Dropbox-synced directory, then run on a
+    thread pool.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".html") and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+        sizes = list(pool.map(_file_size, paths))
+
+    return {Path(path): size for path, size in zip(paths, sizes) if size is not None}
+
+
+def find_files_by_size(
+    html_sizes: Dict[Path, int],
+    directory: Path,
+    target_size: int,
+    tolerance: int,
+    verbose: bool = False,
+) -> List[Path]:
     files: List[Path] = []
-    all_files = list(directory.glob("*.html"))
-    print(f"\nDebug: Found {len(all_files)} HTML files in {directory}")
-    
-    for p in all_files:
-        try:
-            if p.is_file():
-                size = p.stat().st_size
-                in_range = target_size - tolerance <= size <= target_size + tolerance
-                print(f"  {p.name}: {size} bytes {'✓' if in_range else '✗'}")
-                if in_range:
-                    files.append(p)
-        except FileNotFoundError:
-            print(f"  {p.name}: FILE NOT FOUND")
-            continue
-    
+
+    for path, size in html_sizes.items():
+        in_range = target_size - tolerance <= size <= target_size + tolerance
+        # One line per file swamps the terminal on large directories
+        if verbose:
+            print(f"  {path.name}: {size} bytes {'✓' if in_range else '✗'}")
+        if in_range:
+            files.append(path)
+
+    print(f"\nDebug: Found {len(html_sizes)} HTML files in {directory}")
     print(f"Debug: {len(files)} files match size criteria")
     return files
 
@@ -79,6 +119,11 @@ def main() -> None:
         default=DEFAULT_TOLERANCE_BYTES,
         help="Allowed +/- byte tolerance when matching size (default: 500)",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the size of every scanned HTML file",
+    )
     args = parser.parse_args()
 
     target_size = max(0, args.size_bytes)
@@ -95,14 +140,16 @@ def main() -> None:
     conn = db.connect()
 
     try:
-        rows = conn.execute(
+        # Column arrays rather than one Python tuple per row
+        columns = conn.execute(
             "SELECT doi, html_file_path FROM ssrn_pages WHERE html_file_path IS NOT NULL"
-        ).fetchall()
+        ).fetchnumpy()
+        record_count = len(columns["doi"])
         
-        print(f"\nDebug: Found {len(rows)} DB records with HTML paths")
+        print(f"\nDebug: Found {record_count} DB records with HTML paths")
 
         doi_to_abs: Dict[str, Path] = {}
-        for doi, portable in rows:
+        for doi, portable in zip(columns["doi"], columns["html_file_path"]):
             abs_path = portable_to_absolute(portable)
             if abs_path:
                 doi_to_abs[str(doi)] = abs_path
@@ -110,16 +157,22 @@ def main() -> None:
                 if len(doi_to_abs) <= 3:
                     print(f"  {doi}: {portable} -> {abs_path}")
         
-        if len(rows) > 3:
-            print(f"  ... and {len(rows) - 3} more records")
+        if record_count > 3:
+            print(f"  ... and {record_count - 3} more records")
 
         to_delete_db: List[Tuple[str, Path]] = []
         print(f"\nDebug: Checking DB-referenced files for size match...")
         
+        # Sizes come from one scan of the HTML directory; only paths outside it
+        # (e.g. written on another machine) need their own stat()
+        html_sizes = scan_html_sizes(HTML_DIR)
+
         for doi, path in doi_to_abs.items():
             try:
-                if path.exists():
-                    size = path.stat().st_size
+                size = html_sizes.get(path)
+                if size is None and path.parent != HTML_DIR:
+                    size = _file_size(str(path))
+                if size is not None:
                     in_range = target_size - tolerance <= size <= target_size + tolerance
                     if len(to_delete_db) < 5:  # Show first few for debugging
                         print(f"  {doi}: {size} bytes at {to_portable(path)} {'✓' if in_range else '✗'}")
@@ -133,7 +186,7 @@ def main() -> None:
         
         print(f"Debug: {len(to_delete_db)} DB records match size criteria")
 
-        dir_matches = set(find_files_by_size(HTML_DIR, target_size, tolerance))
+        dir_matches = set(find_files_by_size(html_sizes, HTML_DIR, target_size, tolerance, args.verbose))
         db_match_files = {p for _, p in to_delete_db}
         orphan_files = dir_matches - db_match_files
 
@@ -141,9 +194,22 @@ def main() -> None:
         deleted_files = 0
         deleted_dois: List[str] = []
 
+        if to_delete_db:
+            # One set-based DELETE; DuckDB reads the DOI list straight from the DataFrame
+            dois_to_delete = pd.DataFrame({"doi": [doi for doi, _ in to_delete_db]})
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute("DELETE FROM ssrn_pages WHERE doi IN (SELECT doi FROM dois_to_delete)")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            deleted_db = len(dois_to_delete)
+
+        # Files are only removed once the DB rows are committed, so an aborted
+        # run never leaves ssrn_pages rows pointing at deleted HTML
+
         for doi, path in to_delete_db:
-            conn.execute("DELETE FROM ssrn_pages WHERE doi = ?", [doi])
-            deleted_db += 1
             deleted_dois.append(doi)
             try:
                 if path.exists():
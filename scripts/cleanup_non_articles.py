@@ -6,6 +6,8 @@ non-article content that may have been collected before filtering was added.
 
 Run: poetry run python scripts/cleanup_non_articles.py
 """
+import re
+
 from cite_hustle.config import settings
 from cite_hustle.database.models import DatabaseManager
 from cite_hustle.database.repository import ArticleRepository
@@ -33,10 +35,10 @@ def cleanup_non_articles():
     print("CLEANING UP NON-ARTICLE CONTENT")
     print("="*60)
     
-    # Connect to database
+    # Connect read-only while reviewing, so other readers are not locked out
     print(f"\nConnecting to: {settings.db_path}")
     db = DatabaseManager(settings.db_path)
-    db.connect()
+    db.connect(read_only=True)
     repo = ArticleRepository(db)
     
     # Check total before cleanup
@@ -46,30 +48,24 @@ def cleanup_non_articles():
     # Find non-articles
     print("\nSearching for non-article content...")
     
-    # Build SQL query to find matching titles
-    conditions = []
-    for keyword in NON_ARTICLE_KEYWORDS:
-        conditions.append(f"LOWER(title) LIKE '%{keyword}%'")
-    
-    # Add pattern matches for titles that are JUST announcements/editorial
-    conditions.append("LOWER(title) = 'announcements'")
-    conditions.append("LOWER(title) = 'editorial'")
-    conditions.append("LOWER(title) LIKE 'announcements and%'")
-    conditions.append("LOWER(title) LIKE 'volume %'")
-    conditions.append("LOWER(title) LIKE 'issue %'")
-    conditions.append("LOWER(title) LIKE 'contents%'")
-    
-    where_clause = " OR ".join(conditions)
+    # All substring keywords collapse into one regex alternation that is bound
+    # as a parameter, so DuckDB evaluates a single predicate per title
+    keyword_pattern = '|'.join(re.escape(keyword) for keyword in NON_ARTICLE_KEYWORDS)
     
-    # Find matching articles
-    query = f"""
+    # Also match titles that are JUST announcements/editorial
+    query = """
         SELECT doi, title, year, journal_name
         FROM articles
-        WHERE {where_clause}
+        WHERE regexp_matches(LOWER(title), ?)
+           OR LOWER(title) IN ('announcements', 'editorial')
+           OR LOWER(title) LIKE 'announcements and%'
+           OR LOWER(title) LIKE 'volume %'
+           OR LOWER(title) LIKE 'issue %'
+           OR LOWER(title) LIKE 'contents%'
         ORDER BY year DESC, title
     """
     
-    non_articles = db.conn.execute(query).fetchdf()
+    non_articles = db.conn.execute(query, [keyword_pattern]).fetchdf()
     
     if non_articles.empty:
         print("\n✓ No non-article content found!")
@@ -101,18 +97,24 @@ def cleanup_non_articles():
         print("No items were deleted.")
         return
     
+    # Only take the write lock once the deletion is confirmed
+    db.close()
+    db.connect(max_wait=120)
+    repo = ArticleRepository(db)
+    
     # Delete non-articles
     print("\nDeleting non-article content...")
     
-    dois_to_delete = non_articles['doi'].tolist()
+    # One set-based DELETE per table; DuckDB reads the DOI list straight from the DataFrame
+    dois_to_delete = non_articles[['doi']]
     
-    # Delete from ssrn_pages first (foreign key constraint)
-    for doi in dois_to_delete:
-        db.conn.execute("DELETE FROM ssrn_pages WHERE doi = ?", [doi])
+    # Delete from ssrn_pages first (foreign key constraint). The two statements
+    # commit separately: DuckDB still sees the deleted child rows when checking
+    # the articles delete inside the same transaction and rejects it.
+    db.conn.execute("DELETE FROM ssrn_pages WHERE doi IN (SELECT doi FROM dois_to_delete)")
     
     # Delete from articles
-    for doi in dois_to_delete:
-        db.conn.execute("DELETE FROM articles WHERE doi = ?", [doi])
+    db.conn.execute("DELETE FROM articles WHERE doi IN (SELECT doi FROM dois_to_delete)")
     
     # Check total after cleanup
     total_after = repo.get_article_count()
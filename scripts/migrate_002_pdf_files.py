@@ -16,6 +16,9 @@ Usage:
 """
 
 import argparse
+from pathlib import Path
+
+import pandas as pd
 
 from cite_hustle.config import settings
 from cite_hustle.database.models import DatabaseManager
@@ -37,6 +40,8 @@ def main():
     pdf_dir = settings.pdf_storage_dir
     migrated, repaired_paths, adopted, missing = 0, 0, 0, []
     handled_dois = set()
+    # (doi, ssrn_url, local path, match_score); written in one batch at the end
+    to_record = []
 
     # Pass 1: tracked downloads (paths possibly from other machines)
     rows = db.conn.execute(
@@ -60,51 +65,53 @@ def main():
             else:
                 missing.append((doi, pdf_file_path))
                 continue
-        if not args.dry_run:
-            repo.upsert_pdf_file(
-                doi=doi,
-                source="ssrn",
-                source_url=ssrn_url,
-                pdf_url=None,
-                pdf_file_path=str(local),
-                match_score=match_score,
-            )
-            repo.update_pdf_info(doi=doi, pdf_url=None, pdf_file_path=str(local), downloaded=True)
+        to_record.append((doi, ssrn_url, str(local), match_score))
         handled_dois.add(doi)
         migrated += 1
 
-    # Pass 2: orphaned PDFs on disk with no pdf_files row
-    for pdf_path in sorted(pdf_dir.glob("*.pdf")):
-        row = db.conn.execute(
-            """
-            SELECT a.doi, s.ssrn_url, s.match_score, p.doi IS NOT NULL AS tracked
-            FROM articles a
-            LEFT JOIN ssrn_pages s ON a.doi = s.doi
-            LEFT JOIN pdf_files p ON a.doi = p.doi
-            WHERE replace(a.doi, '/', '_') || '.pdf' = ?
-        """,
-            [pdf_path.name],
-        ).fetchone()
-        if row is None:
-            missing.append((f"(no article for {pdf_path.name})", str(pdf_path)))
+    # Pass 2: orphaned PDFs on disk with no pdf_files row, matched to articles
+    # by DOI-slug filename in a single join rather than one query per file
+    pdf_paths = sorted(pdf_dir.glob("*.pdf"))
+    pdf_names = pd.DataFrame(
+        {"file_name": [p.name for p in pdf_paths], "pdf_path": [str(p) for p in pdf_paths]},
+        columns=["file_name", "pdf_path"],
+    )
+    orphans = db.conn.execute(
+        """
+        SELECT f.pdf_path, a.doi, s.ssrn_url, s.match_score, p.doi IS NOT NULL AS tracked
+        FROM pdf_names f
+        LEFT JOIN articles a ON replace(a.doi, '/', '_') || '.pdf' = f.file_name
+        LEFT JOIN ssrn_pages s ON a.doi = s.doi
+        LEFT JOIN pdf_files p ON a.doi = p.doi
+        ORDER BY f.file_name
+    """
+    ).fetchall()
+
+    for pdf_path, doi, ssrn_url, match_score, tracked in orphans:
+        if doi is None:
+            missing.append((f"(no article for {Path(pdf_path).name})", pdf_path))
             continue
-        doi, ssrn_url, match_score, tracked = row
         if tracked or doi in handled_dois:
             continue  # already recorded, or handled in pass 1
-        if not args.dry_run:
-            repo.upsert_pdf_file(
-                doi=doi,
-                source="ssrn",
-                source_url=ssrn_url,
-                pdf_url=None,
-                pdf_file_path=str(pdf_path),
-                match_score=match_score,
-            )
-            repo.update_pdf_info(
-                doi=doi, pdf_url=None, pdf_file_path=str(pdf_path), downloaded=True
-            )
+        to_record.append((doi, ssrn_url, pdf_path, match_score))
         adopted += 1
 
+    if not args.dry_run:
+        repo.bulk_upsert_pdf_files(
+            [
+                {
+                    "doi": doi,
+                    "source": "ssrn",
+                    "source_url": ssrn_url,
+                    "pdf_url": None,
+                    "pdf_file_path": path,
+                    "match_score": match_score,
+                }
+                for doi, ssrn_url, path, match_score in to_record
+            ]
+        )
+        repo.bulk_update_pdf_info([(doi, None, path, True) for doi, _, path, _ in to_record])
+
     action = "Would migrate" if args.dry_run else "Migrated"
     print(f"✓ {action} {migrated} tracked PDFs ({repaired_paths} with repaired paths)")
     print(f"✓ {action.replace('migrate', 'adopt')} {adopted} orphaned PDFs from disk")
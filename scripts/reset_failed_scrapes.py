@@ -15,13 +15,14 @@ Options:
     --year-cutoff YEAR    Only reset articles from this year onwards (default: 2000)
     --dry-run             Show what would be deleted without making changes
     --include-low-match   Also include "No match above threshold" failures
+    --yes, -y             Delete without the review report or confirmation prompt
 """
 
 import argparse
 import sys
 
 from cite_hustle.config import settings
-from cite_hustle.database.models import DatabaseManager
+from cite_hustle.database.models import SSRN_ERROR_CODE_SQL, DatabaseManager
 
 
 def main():
@@ -41,6 +42,9 @@ Examples:
 
     # Include low-match failures too
     poetry run python scripts/reset_failed_scrapes.py --include-low-match
+
+    # Unattended: skip the report and prompt
+    poetry run python scripts/reset_failed_scrapes.py --yes
         """,
     )
     parser.add_argument(
@@ -57,35 +61,79 @@ Examples:
         action="store_true",
         help="Also include 'No match above threshold' failures",
     )
+    parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        help="Delete without the review report or confirmation prompt",
+    )
 
     args = parser.parse_args()
+    unattended = args.yes and not args.dry_run
 
-    # Connect to database
+    # Connect read-only while reviewing, so other readers are not locked out;
+    # an unattended run goes straight to the single DELETE
     print(f"📁 Database: {settings.db_path}")
     db = DatabaseManager(settings.db_path)
-    db.connect()
+    if unattended:
+        db.connect(max_wait=120)
+    else:
+        db.connect(read_only=True)
+
+    # Build error conditions on the classified error_code. A read-only
+    # connection to a database from before that column existed cannot add it,
+    # so classify the messages inline instead (see SSRN_ERROR_CODE_SQL).
+    if db.has_column("ssrn_pages", "error_code"):
+        error_code = "s.error_code"
+    else:
+        error_code = SSRN_ERROR_CODE_SQL.format(message="s.error_message")
 
-    # Build error conditions
-    error_conditions = [
-        "s.error_message LIKE '%No search results%'",
-        "s.error_message LIKE '%Failed to search SSRN%'",
-    ]
+    error_codes = ["'NO_RESULTS'", "'SEARCH_FAILED'"]
 
     if args.include_low_match:
-        error_conditions.append("s.error_message LIKE '%No match above threshold%'")
+        error_codes.append("'LOW_MATCH'")
 
-    error_where = " OR ".join(error_conditions)
+    error_where = f"{error_code} IN ({', '.join(error_codes)})"
 
-    # Count articles to reset
-    count_query = f"""
-        SELECT COUNT(*)
+    # Delete the entries; USING lets DuckDB plan a plain hash join
+    delete_query = f"""
+        DELETE FROM ssrn_pages AS s
+        USING articles a
+        WHERE s.doi = a.doi
+        AND ({error_where})
+        AND a.year >= ?
+    """
+
+    if unattended:
+        deleted = db.conn.execute(delete_query, [args.year_cutoff]).fetchone()[0]
+        print(f"✓ Deleted {deleted:,} failed scrapes (year {args.year_cutoff}+)")
+        db.close()
+        return 0
+
+    # Every report below reads the same filtered join: run it once into a
+    # temp table (allowed on a read-only connection) instead of re-planning
+    # and re-joining it per query. The totals and the per-error breakdown
+    # come from a single conditional-aggregation scan.
+    db.conn.execute(
+        f"""
+        CREATE TEMP TABLE filtered AS
+        SELECT a.year, a.title, {error_code} AS error_code
         FROM ssrn_pages s
         JOIN articles a ON s.doi = a.doi
         WHERE ({error_where})
         AND a.year >= ?
-    """
+    """,
+        [args.year_cutoff],
+    )
 
-    total_count = db.conn.execute(count_query, [args.year_cutoff]).fetchone()[0]
+    total_count, no_results, failed_search, low_match = db.conn.execute("""
+        SELECT
+            COUNT(*),
+            COUNT(*) FILTER (WHERE error_code = 'NO_RESULTS'),
+            COUNT(*) FILTER (WHERE error_code = 'SEARCH_FAILED'),
+            COUNT(*) FILTER (WHERE error_code = 'LOW_MATCH')
+        FROM filtered
+    """).fetchone()
 
     print(f"\n{'=' * 60}")
     print(f"🔄 RESET FAILED SCRAPES")
@@ -103,17 +151,13 @@ Examples:
 
     # Show breakdown by year
     print("\n--- By Year ---")
-    year_query = f"""
-        SELECT a.year, COUNT(*) as count
-        FROM ssrn_pages s
-        JOIN articles a ON s.doi = a.doi
-        WHERE ({error_where})
-        AND a.year >= ?
-        GROUP BY a.year
-        ORDER BY a.year DESC
+    years = db.conn.execute("""
+        SELECT year, COUNT(*) as count
+        FROM filtered
+        GROUP BY year
+        ORDER BY year DESC
         LIMIT 10
-    """
-    years = db.conn.execute(year_query, [args.year_cutoff]).fetchall()
+    """).fetchall()
     for year, count in years:
         print(f"  {year}: {count:,}")
     if len(years) == 10:
@@ -121,58 +165,23 @@ Examples:
 
     # Show breakdown by error type
     print("\n--- By Error Type ---")
-
-    # No search results
-    no_results = db.conn.execute(
-        f"""
-        SELECT COUNT(*) FROM ssrn_pages s
-        JOIN articles a ON s.doi = a.doi
-        WHERE s.error_message LIKE '%No search results%'
-        AND a.year >= ?
-    """,
-        [args.year_cutoff],
-    ).fetchone()[0]
     print(f"  No search results: {no_results:,}")
-
-    # Failed to search
-    failed_search = db.conn.execute(
-        f"""
-        SELECT COUNT(*) FROM ssrn_pages s
-        JOIN articles a ON s.doi = a.doi
-        WHERE s.error_message LIKE '%Failed to search SSRN%'
-        AND a.year >= ?
-    """,
-        [args.year_cutoff],
-    ).fetchone()[0]
     print(f"  Failed to search SSRN: {failed_search:,}")
-
     if args.include_low_match:
-        low_match = db.conn.execute(
-            f"""
-            SELECT COUNT(*) FROM ssrn_pages s
-            JOIN articles a ON s.doi = a.doi
-            WHERE s.error_message LIKE '%No match above threshold%'
-            AND a.year >= ?
-        """,
-            [args.year_cutoff],
-        ).fetchone()[0]
         print(f"  No match above threshold: {low_match:,}")
 
     # Show sample titles
     print("\n--- Sample Articles to Reset ---")
-    sample_query = f"""
-        SELECT a.title, a.year, a.journal_name
-        FROM ssrn_pages s
-        JOIN articles a ON s.doi = a.doi
-        WHERE ({error_where})
-        AND a.year >= ?
-        ORDER BY a.year DESC
+    samples = db.conn.execute("""
+        SELECT
+            CASE WHEN LENGTH(title) > 55 THEN SUBSTR(title, 1, 55) || '...' ELSE title END,
+            year
+        FROM filtered
+        ORDER BY year DESC
         LIMIT 5
-    """
-    samples = db.conn.execute(sample_query, [args.year_cutoff]).fetchall()
-    for title, year, journal in samples:
-        t = (title[:55] + "...") if len(title) > 55 else title
-        print(f"  [{year}] {t}")
+    """).fetchall()
+    for title, year in samples:
+        print(f"  [{year}] {title}")
 
     if args.dry_run:
         print(f"\n{'=' * 60}")
@@ -197,24 +206,13 @@ Examples:
         print("\n❌ Cancelled.")
         return 1
 
-    # Delete the entries
-    delete_query = f"""
-        DELETE FROM ssrn_pages
-        WHERE doi IN (
-            SELECT s.doi
-            FROM ssrn_pages s
-            JOIN articles a ON s.doi = a.doi
-            WHERE ({error_where})
-            AND a.year >= ?
-        )
-    """
+    # Only take the write lock once the deletion is confirmed
+    db.close()
+    db.connect(max_wait=120)
 
     print("\n🗑️  Deleting entries...")
-    db.conn.execute(delete_query, [args.year_cutoff])
-
-    # Verify deletion
-    remaining = db.conn.execute(count_query, [args.year_cutoff]).fetchone()[0]
-    deleted = total_count - remaining
+    deleted = db.conn.execute(delete_query, [args.year_cutoff]).fetchone()[0]
+    remaining = total_count - deleted
 
     print(f"\n{'=' * 60}")
     print(f"✓ RESET COMPLETE")
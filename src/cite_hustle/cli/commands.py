@@ -7,22 +7,28 @@ from pathlib import Path
 import click
 
 from cite_hustle.collectors.journals import JournalRegistry
-from cite_hustle.collectors.metadata import MetadataCollector
-from cite_hustle.collectors.openalex_enricher import OpenAlexEnricher
-from cite_hustle.collectors.selenium_pdf_downloader import SeleniumPDFDownloader
-from cite_hustle.collectors.ssrn_scraper import SSRNScraper
 from cite_hustle.config import settings
-from cite_hustle.database.models import DatabaseManager
+from cite_hustle.database.models import get_db
 from cite_hustle.database.repository import ArticleRepository
 
 
 # Commands that only read the database. These open it read-only so they can run
 # alongside other readers (e.g. the rainer MCP server) without a lock conflict.
-READ_ONLY_COMMANDS = {"status", "dashboard", "journals", "search", "sample", "wiki-index"}
+READ_ONLY_COMMANDS = {"status", "dashboard", "search", "sample", "wiki-index"}
+
+# Commands that never touch the database and skip opening it entirely.
+NO_DB_COMMANDS = {"journals"}
 
 # Seconds a write command waits for another process to release the DB file.
 WRITE_LOCK_WAIT_SECONDS = 120
 
+# Papers download writes to the database per commit; see download()
+DOWNLOAD_WRITE_BATCH = 25
+
+# DuckDB FTS indexes can only be rebuilt in full, so collect skips the title
+# rebuild until the unindexed articles exceed this fraction of the index.
+FTS_REBUILD_FRACTION = 0.10
+
 
 @click.group()
 @click.pass_context
@@ -34,8 +40,13 @@ def main(ctx):
     """
     ctx.ensure_object(dict)
 
-    # Help text and bare invocation don't touch the database.
-    if ctx.invoked_subcommand is None or "--help" in sys.argv or "-h" in sys.argv:
+    # Help text, bare invocation and registry-only commands don't touch the database.
+    if (
+        ctx.invoked_subcommand is None
+        or ctx.invoked_subcommand in NO_DB_COMMANDS
+        or "--help" in sys.argv
+        or "-h" in sys.argv
+    ):
         return
 
     read_only = ctx.invoked_subcommand in READ_ONLY_COMMANDS
@@ -47,8 +58,8 @@ def main(ctx):
 
         preflight_guards(settings.db_path)
 
-    db_manager = DatabaseManager(settings.db_path)
-    db_manager.connect(
+    db_manager = get_db(
+        settings.db_path,
         read_only=read_only,
         max_wait=0 if read_only else WRITE_LOCK_WAIT_SECONDS,
     )
@@ -62,6 +73,7 @@ def main(ctx):
 def init(ctx):
     """Initialize the database schema"""
     db = ctx.obj["db"]
+    repo = ctx.obj["repo"]
 
     click.echo(f"📁 Database location: {settings.db_path}")
     click.echo(f"📁 Data directory: {settings.data_dir}")
@@ -71,7 +83,9 @@ def init(ctx):
 
     click.echo("\nInitializing database schema...")
     db.initialize_schema()
-    db.create_fts_indexes()
+    # On a fresh database the first collect builds the indexes on real data
+    if repo.get_article_count() > 0:
+        db.create_fts_indexes()
 
     click.echo("\n✓ Database initialized successfully!")
 
@@ -89,11 +103,12 @@ def journals(field):
 
     click.echo(f"\n📚 {field.upper()} JOURNALS ({len(journals_list)} total)\n")
 
+    lines = []
     for j in journals_list:
-        click.echo(f"  • {j.name}")
-        click.echo(f"    ISSN: {j.issn} | Publisher: {j.publisher}")
-
-    click.echo()
+        lines.append(f"  • {j.name}")
+        lines.append(f"    ISSN: {j.issn} | Publisher: {j.publisher}")
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -126,6 +141,8 @@ def collect(ctx, field, year_start, year_end, parallel, skip_fts_rebuild, force)
 
     After collection completes, FTS indexes are automatically rebuilt
     to make the new articles searchable (use --skip-fts-rebuild to disable).
+    Small top-ups that add no more than 10% to the title index skip the
+    rebuild; run rebuild-fts to index them right away.
 
     Use --force to refresh metadata for years that were previously collected.
     This clears the cache files and fetches fresh data from CrossRef.
@@ -135,6 +152,8 @@ def collect(ctx, field, year_start, year_end, parallel, skip_fts_rebuild, force)
         cite-hustle collect --field all --year-start 2023
         cite-hustle collect --field all --year-start 2024 --year-end 2025 --force
     """
+    from cite_hustle.collectors.metadata import MetadataCollector
+
     repo = ctx.obj["repo"]
     db = ctx.obj["db"]
 
@@ -163,17 +182,25 @@ def collect(ctx, field, year_start, year_end, parallel, skip_fts_rebuild, force)
         cache_cleared = 0
         for journal in journals_list:
             for year in years:
-                cache_file = settings.cache_dir / f"cache_{journal.issn}_{year}.json"
+                cache_file = settings.cache_dir / f"cache_{journal.issn}_{year}.jsonl.gz"
                 if cache_file.exists():
                     cache_file.unlink()
                     cache_cleared += 1
         click.echo(f"   Deleted {cache_cleared} cache files\n")
 
     # Collect metadata
-    if parallel:
-        results = collector.collect_parallel(journals_list, years, force=force)
-    else:
-        results = collector.collect_for_journals(journals_list, years, force=force)
+    try:
+        if parallel:
+            results = collector.collect_parallel(journals_list, years, force=force)
+        else:
+            results = collector.collect_for_journals(journals_list, years, force=force)
+    except KeyboardInterrupt:
+        # Articles saved before the interrupt are already committed; index
+        # them now rather than leaving search stale until the next rebuild
+        if not skip_fts_rebuild:
+            click.echo("\n⚠️  Interrupted - indexing the articles collected so far...")
+            db.create_fts_indexes(abstracts="ssrn_pages" not in db.get_fts_index_sizes())
+        raise
 
     # Summary
     total_collected = sum(results.values())
@@ -184,20 +211,36 @@ def collect(ctx, field, year_start, year_end, parallel, skip_fts_rebuild, force)
     click.echo(f"Total articles collected: {total_collected:,}")
 
     if results:
-        click.echo(f"\nBreakdown by journal:")
+        lines = [f"\nBreakdown by journal:"]
         for journal_name, count in sorted(results.items(), key=lambda x: x[1], reverse=True):
             if count > 0:
-                click.echo(f"  • {journal_name}: {count:,} articles")
-
-    # Rebuild FTS indexes if new articles were collected
-    if total_collected > 0 and not skip_fts_rebuild:
+                lines.append(f"  • {journal_name}: {count:,} articles")
+        click.echo("\n".join(lines))
+
+    # Rebuild FTS indexes if enough new articles were collected. A forced
+    # refresh may rewrite existing titles, so it always rebuilds.
+    index_sizes = db.get_fts_index_sizes()
+    indexed = index_sizes.get("articles", 0)
+    unindexed = repo.get_article_count() - indexed
+    if (
+        total_collected > 0
+        and not skip_fts_rebuild
+        and not force
+        and indexed
+        and unindexed <= indexed * FTS_REBUILD_FRACTION
+    ):
+        click.echo(f"\n{unindexed:,} new articles are below the search index rebuild threshold")
+        click.echo("Make them searchable now with: poetry run cite-hustle rebuild-fts")
+    elif total_collected > 0 and not skip_fts_rebuild:
         click.echo(f"\n{'=' * 60}")
         click.echo("🔍 REBUILDING SEARCH INDEXES")
         click.echo(f"{'=' * 60}")
         click.echo("Updating full-text search indexes for new articles...")
 
         try:
-            db.create_fts_indexes()
+            # collect only adds articles, so the abstract index is unaffected
+            # unless this is the first collect and it was never built
+            db.create_fts_indexes(abstracts="ssrn_pages" not in index_sizes)
             click.echo("✓ Search indexes updated successfully!")
             click.echo("\nNew articles are now searchable via:")
             click.echo("  poetry run cite-hustle search 'your query'")
@@ -214,8 +257,16 @@ def collect(ctx, field, year_start, year_end, parallel, skip_fts_rebuild, force)
 @click.option("--delay", default=5, type=int, help="Delay between requests (seconds)")
 @click.option("--threshold", default=85, type=int, help="Minimum similarity threshold (0-100)")
 @click.option("--headless/--no-headless", default=True, help="Run browser in headless mode")
+@click.option(
+    "--workers",
+    "--jobs",
+    "workers",
+    default=1,
+    type=int,
+    help="Parallel browser sessions (may trigger rate limits)",
+)
 @click.pass_context
-def scrape(ctx, limit, delay, threshold, headless):
+def scrape(ctx, limit, delay, threshold, headless, workers):
     """
     Scrape SSRN for article pages and abstracts
 
@@ -226,10 +277,14 @@ def scrape(ctx, limit, delay, threshold, headless):
         cite-hustle scrape --limit 10
         cite-hustle scrape --delay 3 --threshold 90
         cite-hustle scrape --no-headless  # Show browser (for debugging)
+        cite-hustle scrape --workers 3
     """
+    from cite_hustle.collectors.ssrn_scraper import SSRNScraper
+
     repo = ctx.obj["repo"]
 
-    # Get pending articles
+    # Get pending articles in one query; workers pull from a shared in-process
+    # queue rather than each querying their own slice
     pending = repo.get_pending_ssrn_scrapes(limit=limit)
 
     if pending.empty:
@@ -243,6 +298,7 @@ def scrape(ctx, limit, delay, threshold, headless):
     click.echo(f"Crawl delay: {delay} seconds")
     click.echo(f"Similarity threshold: {threshold}")
     click.echo(f"Headless mode: {'Yes' if headless else 'No'}")
+    click.echo(f"Browser workers: {workers}")
     click.echo(f"HTML storage: {settings.html_storage_dir}")
     click.echo(f"{'=' * 60}\n")
 
@@ -253,7 +309,7 @@ def scrape(ctx, limit, delay, threshold, headless):
 
     # Scrape articles
     try:
-        stats = scraper.scrape_articles(pending, show_progress=True)
+        stats = scraper.scrape_articles(pending, show_progress=True, workers=workers)
 
         # Summary
         click.echo(f"\n{'=' * 60}")
@@ -313,6 +369,8 @@ def enrich_openalex(
         cite-hustle enrich-openalex --year-start 2020 --year-end 2024 --concurrency 3
         cite-hustle enrich-openalex --force --skip-fts-rebuild
     """
+    from cite_hustle.collectors.openalex_enricher import OpenAlexEnricher
+
     repo = ctx.obj["repo"]
     db = ctx.obj["db"]
 
@@ -358,7 +416,8 @@ def enrich_openalex(
     if stats["updated"] > 0 and not skip_fts_rebuild:
         click.echo("\nRebuilding FTS indexes...")
         try:
-            db.create_fts_indexes()
+            # Only abstracts changed; the title index is unaffected
+            db.create_fts_indexes(titles=False)
             click.echo("✓ Search indexes updated successfully!")
         except Exception as e:
             click.echo(f"⚠️  Warning: Failed to rebuild FTS indexes: {e}")
@@ -388,8 +447,16 @@ def enrich_openalex(
     is_flag=True,
     help="Also re-try papers previously marked 'not available for download'.",
 )
+@click.option(
+    "--workers",
+    "--jobs",
+    "workers",
+    default=1,
+    type=int,
+    help="Parallel browser windows, reused across papers (may trigger rate limits)",
+)
 @click.pass_context
-def download(ctx, limit, delay, headless, use_selenium, retry_unavailable):
+def download(ctx, limit, delay, headless, use_selenium, retry_unavailable, workers):
     """
     Download SSRN PDFs into the storage directory.
 
@@ -397,8 +464,8 @@ def download(ctx, limit, delay, headless, use_selenium, retry_unavailable):
     Cloudflare protection, then clicks the paper's download button. Papers with
     no posted full text are marked unavailable and skipped on later runs.
 
-    Progress is saved after every paper, so the run resumes where it left off
-    and is safe to leave running unattended (e.g. overnight):
+    Progress is saved every few papers and on exit, so the run resumes where it
+    left off and is safe to leave running unattended (e.g. overnight):
 
         caffeinate -i poetry run cite-hustle download   # macOS: prevent sleep
 
@@ -406,23 +473,27 @@ def download(ctx, limit, delay, headless, use_selenium, retry_unavailable):
         cite-hustle download                      # all pending papers
         cite-hustle download --limit 50
         cite-hustle download --no-headless --limit 5   # watch the browser
+        cite-hustle download --workers 2          # two browser windows
     """
+    from cite_hustle.collectors.selenium_pdf_downloader import SeleniumPDFDownloader
+
     repo = ctx.obj["repo"]
 
     if not use_selenium:
         click.echo("ℹ️  The HTTP download path was removed; using the browser downloader.\n")
 
+    # Plain tuples: the rows are iterated once, so no DataFrame is needed
     articles = repo.get_articles_with_ssrn_urls(
-        limit=limit, downloaded=False, include_unavailable=retry_unavailable
+        limit=limit, downloaded=False, include_unavailable=retry_unavailable, as_df=False
     )
-    if articles.empty:
+    if not articles:
         click.echo("✓ No papers pending PDF download")
         return
 
     download_list = [
-        {"doi": row["doi"], "ssrn_url": row["ssrn_url"]}
-        for _, row in articles.iterrows()
-        if row.get("ssrn_url")
+        {"doi": doi, "ssrn_url": ssrn_url}
+        for doi, _title, ssrn_url, *_ in articles
+        if ssrn_url
     ]
     if not download_list:
         click.echo("✗ No valid SSRN URLs found")
@@ -432,7 +503,7 @@ def download(ctx, limit, delay, headless, use_selenium, retry_unavailable):
     click.echo(f"Storage: {settings.pdf_storage_dir}")
     click.echo(
         f"Browser: {'Headless (not recommended)' if headless else 'Visible'} | "
-        f"base delay: {delay}s\n"
+        f"base delay: {delay}s | workers: {workers}\n"
     )
 
     downloader = SeleniumPDFDownloader(
@@ -441,27 +512,51 @@ def download(ctx, limit, delay, headless, use_selenium, retry_unavailable):
 
     ssrn_urls = {item["doi"]: item["ssrn_url"] for item in download_list}
 
+    # Results are written every DOWNLOAD_WRITE_BATCH papers, so the Dropbox-synced
+    # database file sees one commit per batch instead of one per paper. A PDF
+    # that reached disk but not the database is found as "already present" on
+    # the next run and recorded then, so an interrupt loses no downloads.
+    pdf_updates, pdf_files, logs = [], [], []
+
+    def flush():
+        # Never a download that is only half recorded
+        with repo.transaction():
+            repo.bulk_update_pdf_info(pdf_updates)
+            repo.bulk_upsert_pdf_files(pdf_files)
+            repo.bulk_log_processing(logs)
+        pdf_updates.clear()
+        pdf_files.clear()
+        logs.clear()
+
     def persist(result):
-        """Update the DB after each paper so progress survives interruptions."""
+        """Queue the DB writes for one paper, flushing once a batch is full."""
         doi = result["doi"]
         if result["success"]:
-            repo.update_pdf_info(
-                doi=doi, pdf_url=None, pdf_file_path=result.get("filepath"), downloaded=True
-            )
-            repo.upsert_pdf_file(
-                doi=doi,
-                source="ssrn",
-                source_url=ssrn_urls.get(doi),
-                pdf_url=None,
-                pdf_file_path=result.get("filepath"),
+            pdf_updates.append((doi, None, result.get("filepath"), True))
+            pdf_files.append(
+                {
+                    "doi": doi,
+                    "source": "ssrn",
+                    "source_url": ssrn_urls.get(doi),
+                    "pdf_url": None,
+                    "pdf_file_path": result.get("filepath"),
+                    "match_score": None,
+                }
             )
-            repo.log_processing(doi, "download_pdf", "success")
+            logs.append((doi, "download_pdf", "success", None))
         elif result["status"] == "unavailable":
-            repo.mark_pdf_unavailable(doi)
+            # Same entry mark_pdf_unavailable writes
+            logs.append((doi, "download_pdf", "unavailable", "Not available for download"))
         else:
-            repo.log_processing(doi, "download_pdf", "failed", result.get("error"))
+            logs.append((doi, "download_pdf", "failed", result.get("error")))
 
-    downloader.download_batch(download_list, on_result=persist)
+        if len(logs) >= DOWNLOAD_WRITE_BATCH:
+            flush()
+
+    try:
+        downloader.download_batch(download_list, on_result=persist, workers=workers)
+    finally:
+        flush()
     click.echo("\n✓ Download process complete")
 
 
@@ -503,13 +598,14 @@ def resolve_fallbacks(ctx, limit, sources, recheck_days, delay):
     if unknown:
         raise click.BadParameter(f"Unknown sources: {unknown}. Choose from {list(RESOLVERS)}")
 
-    articles = repo.get_articles_without_pdf(limit=limit)
+    cutoff = datetime.now() - timedelta(days=recheck_days)
+    articles = repo.get_articles_without_pdf(
+        limit=limit, sources=source_order, recheck_cutoff=cutoff
+    )
     if articles.empty:
         click.echo("✓ No articles pending fallback resolution")
         return
 
-    cutoff = datetime.now() - timedelta(days=recheck_days)
-    already_checked = repo.get_recent_candidate_checks(cutoff)
     resolvers = {
         name: RESOLVERS[name](threshold=settings.similarity_threshold) for name in source_order
     }
@@ -520,13 +616,12 @@ def resolve_fallbacks(ctx, limit, sources, recheck_days, delay):
     with httpx.Client(
         timeout=30.0, headers={"User-Agent": "cite-hustle/0.1"}, follow_redirects=True
     ) as client:
-        for _, row in articles.iterrows():
-            article = row.to_dict()
+        for article in articles.to_dict("records"):
             doi = article["doi"]
             resolved = False
 
             for name in source_order:
-                if (doi, name) in already_checked:
+                if name in article["checked_sources"]:
                     continue
 
                 try:
@@ -540,7 +635,7 @@ def resolve_fallbacks(ctx, limit, sources, recheck_days, delay):
                     continue
 
                 dest = settings.pdf_storage_dir / doi_slug_filename(doi)
-                success, error = download_pdf(candidate.pdf_url, dest)
+                success, error = download_pdf(candidate.pdf_url, dest, client=client)
                 if not success:
                     repo.record_pdf_candidate(
                         doi,
@@ -553,23 +648,24 @@ def resolve_fallbacks(ctx, limit, sources, recheck_days, delay):
                     )
                     continue
 
-                repo.record_pdf_candidate(
-                    doi,
-                    name,
-                    candidate_url=candidate.candidate_url,
-                    pdf_url=candidate.pdf_url,
-                    match_score=candidate.match_score,
-                    status="downloaded",
-                )
-                repo.upsert_pdf_file(
-                    doi=doi,
-                    source=name,
-                    source_url=candidate.candidate_url,
-                    pdf_url=candidate.pdf_url,
-                    pdf_file_path=str(dest),
-                    match_score=candidate.match_score,
-                )
-                repo.log_processing(doi, "resolve_fallback", "success", None)
+                with repo.transaction():
+                    repo.record_pdf_candidate(
+                        doi,
+                        name,
+                        candidate_url=candidate.candidate_url,
+                        pdf_url=candidate.pdf_url,
+                        match_score=candidate.match_score,
+                        status="downloaded",
+                    )
+                    repo.upsert_pdf_file(
+                        doi=doi,
+                        source=name,
+                        source_url=candidate.candidate_url,
+                        pdf_url=candidate.pdf_url,
+                        pdf_file_path=str(dest),
+                        match_score=candidate.match_score,
+                    )
+                    repo.log_processing(doi, "resolve_fallback", "success", None)
                 click.echo(f"  ✓ {doi}: {name} ({candidate.match_score:.0f})")
                 found += 1
                 resolved = True
@@ -888,35 +984,41 @@ def status(ctx):
 
     stats = repo.get_statistics()
 
-    click.echo("\n" + "=" * 50)
-    click.echo("📊 CITE-HUSTLE STATUS")
-    click.echo("=" * 50)
-
-    click.echo(f"\n📁 Database: {settings.db_path}")
-    db_size = settings.db_path.stat().st_size / 1024 / 1024 if settings.db_path.exists() else 0
-    click.echo(f"   Size: {db_size:.2f} MB")
-
-    click.echo(f"\n📚 Articles: {stats['total_articles']:,}")
+    try:
+        db_size = settings.db_path.stat().st_size / 1024 / 1024
+    except FileNotFoundError:
+        db_size = 0
+
+    # Build the report first and write it once
+    lines = [
+        "\n" + "=" * 50,
+        "📊 CITE-HUSTLE STATUS",
+        "=" * 50,
+        f"\n📁 Database: {settings.db_path}",
+        f"   Size: {db_size:.2f} MB",
+        f"\n📚 Articles: {stats['total_articles']:,}",
+    ]
 
     if stats["by_year"]:
-        click.echo("\n   Recent years:")
+        lines.append("\n   Recent years:")
         for year_stat in stats["by_year"][:5]:
-            click.echo(f"     {year_stat['year']}: {year_stat['count']:,} articles")
+            lines.append(f"     {year_stat['year']}: {year_stat['count']:,} articles")
 
-    click.echo(f"\n🌐 SSRN pages scraped: {stats['ssrn_scraped']:,}")
-    click.echo(f"📄 PDFs downloaded: {stats['pdfs_downloaded']:,}")
+    lines.append(f"\n🌐 SSRN pages scraped: {stats['ssrn_scraped']:,}")
+    lines.append(f"📄 PDFs downloaded: {stats['pdfs_downloaded']:,}")
 
     # Pending tasks
     if stats["pending_ssrn_scrapes"] > 0:
-        click.echo(f"\n⏳ Pending SSRN scrapes: {stats['pending_ssrn_scrapes']:,}")
+        lines.append(f"\n⏳ Pending SSRN scrapes: {stats['pending_ssrn_scrapes']:,}")
 
     if stats["pending_pdf_downloads"] > 0:
-        click.echo(f"⏳ Pending PDF downloads: {stats['pending_pdf_downloads']:,}")
+        lines.append(f"⏳ Pending PDF downloads: {stats['pending_pdf_downloads']:,}")
 
     if stats["pending_ssrn_scrapes"] == 0 and stats["pending_pdf_downloads"] == 0:
-        click.echo("\n✓ All tasks complete!")
+        lines.append("\n✓ All tasks complete!")
 
-    click.echo("\n" + "=" * 50 + "\n")
+    lines.append("\n" + "=" * 50 + "\n")
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -934,12 +1036,14 @@ def sample(ctx, limit):
 
     click.echo(f"\n📚 Sample of {len(articles)} most recent articles:\n")
 
-    for idx, row in articles.iterrows():
-        click.echo(f"{idx + 1}. {row['title']}")
-        click.echo(f"   Authors: {row['authors']}")
-        click.echo(f"   Journal: {row['journal_name']} ({row['year']})")
-        click.echo(f"   DOI: {row['doi']}")
-        click.echo()
+    lines = []
+    for idx, row in enumerate(articles.to_dict("records"), 1):
+        lines.append(f"{idx}. {row['title']}")
+        lines.append(f"   Authors: {row['authors']}")
+        lines.append(f"   Journal: {row['journal_name']} ({row['year']})")
+        lines.append(f"   DOI: {row['doi']}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -956,6 +1060,7 @@ def search(ctx, query, limit, author):
         cite-hustle search "Smith" --author
         cite-hustle search "accounting" --limit 50
     """
+    db = ctx.obj["db"]
     repo = ctx.obj["repo"]
 
     if author:
@@ -967,6 +1072,10 @@ def search(ctx, query, limit, author):
 
     if not results:
         click.echo(f"\n❌ No results found for '{query}'")
+        if not author and "articles" not in db.get_fts_index_sizes():
+            click.echo("\nThe title search index has not been built yet. Build it with:")
+            click.echo("  poetry run cite-hustle rebuild-fts")
+            return
         click.echo("\nTips:")
         click.echo("  • Try different keywords or shorter terms")
         click.echo("  • Search uses full-text indexing with relevance ranking")
@@ -978,19 +1087,26 @@ def search(ctx, query, limit, author):
 
     click.echo(f"\n✓ Found {len(results)} result{'s' if len(results) != 1 else ''}:\n")
 
+    # Build the listing first and write it once; large --limit values would
+    # otherwise cost several writes per result
+    lines = []
     for i, result in enumerate(results, 1):
-        click.echo(f"{i}. {result['title']}")
-        click.echo(f"   Authors: {result['authors']}")
-        click.echo(f"   Journal: {result['journal']} ({result['year']})")
-        click.echo(f"   DOI: {result['doi']}")
+        lines.append(f"{i}. {result['title']}")
+        lines.append(f"   Authors: {result['authors']}")
+        lines.append(f"   Journal: {result['journal']} ({result['year']})")
+        lines.append(f"   DOI: {result['doi']}")
         if "score" in result and result["score"]:
-            click.echo(f"   Relevance: {result['score']:.2f}")
-        click.echo()
+            lines.append(f"   Relevance: {result['score']:.2f}")
+        lines.append("")
+    click.echo("\n".join(lines))
 
 
 @main.command(name="rebuild-fts")
+@click.option(
+    "--smoke-test", is_flag=True, help="Run a sample title search after rebuilding"
+)
 @click.pass_context
-def rebuild_fts(ctx):
+def rebuild_fts(ctx, smoke_test):
     """
     Rebuild full-text search indexes
 
@@ -1018,13 +1134,16 @@ def rebuild_fts(ctx):
         db.create_fts_indexes()
         click.echo("✓ FTS indexes rebuilt successfully!")
 
-        # Test search
-        click.echo("\nTesting search...")
-        results = repo.search_by_title("accounting", limit=3)
-        if results:
-            click.echo(f"✓ Search working! Found {len(results)} results for 'accounting'")
-        else:
-            click.echo("⚠️  Search returned no results (may be normal)")
+        for table, size in db.get_fts_index_sizes().items():
+            click.echo(f"  {table}: {size:,} documents indexed")
+
+        if smoke_test:
+            click.echo("\nTesting search...")
+            results = repo.search_by_title("accounting", limit=3)
+            if results:
+                click.echo(f"✓ Search working! Found {len(results)} results for 'accounting'")
+            else:
+                click.echo("⚠️  Search returned no results (may be normal)")
 
     except Exception as e:
         click.echo(f"❌ Error rebuilding indexes: {e}")
@@ -0,0 +1,115 @@
+"""Worker pool shared by the parallel browser collectors (SSRN scraping, PDF downloads)"""
+
+import concurrent.futures
+import queue
+import threading
+from typing import Any, Callable, List, Tuple
+
+from tqdm import tqdm
+
+# undetected-chromedriver patches its driver binary whenever a browser starts;
+# every start, including restarts mid-run, must hold this lock so two threads
+# never patch it at once
+STARTUP_LOCK = threading.Lock()
+
+
+def run_browser_pool(
+    items: List[Any],
+    workers: int,
+    spawn: Callable[[int], Any],
+    process: Callable[[Any, Any], Tuple[Any, float]],
+    close: Callable[[Any], None],
+    failed: Callable[[Any, Exception], Any],
+    on_result: Callable[[Any], None],
+    desc: str,
+    show_progress: bool = True,
+):
+    """
+    Work through items with several browser sessions pulling from one shared queue
+
+    Each worker thread drives its own browser. Results are handed back so
+    on_result (and with it every database write) runs on the calling thread
+    only, since the DuckDB connection is not safe to share across threads.
+    On Ctrl-C or errors, workers finish their current item and exit, and
+    whatever they produced is still passed to on_result.
+
+    A worker whose browser fails stops; the item it was on is reported
+    through failed(). If every worker stops with items still queued, a
+    RuntimeError is raised once the results in hand have been passed on,
+    rather than returning as if the run had finished.
+
+    Args:
+        items: Work items, handed out in order
+        workers: Number of browser sessions (at most one per item)
+        spawn: Creates worker number i; its browser is opened with setup_webdriver()
+        process: Handles one item on a worker; returns the result and the
+            seconds that worker should pause before its next item
+        close: Shuts a worker's browser down once it is done
+        failed: Builds the result for an item whose worker raised
+        on_result: Called on the calling thread for every result
+        desc: Progress bar label
+        show_progress: Show a tqdm progress bar
+    """
+    workers = min(workers, len(items))
+
+    tasks: queue.Queue = queue.Queue()
+    for item in items:
+        tasks.put(item)
+
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    def worker(index: int):
+        browser = spawn(index)
+        item = None
+        try:
+            browser.setup_webdriver()
+            while not stop.is_set():
+                try:
+                    item = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                result, pause = process(browser, item)
+                item = None
+                results.put(result)
+
+                if pause > 0 and not tasks.empty():
+                    stop.wait(pause)
+        except Exception as e:
+            print(f"✗ Browser worker stopped: {type(e).__name__}: {e}")
+            if item is not None:
+                results.put(failed(item, e))
+        finally:
+            close(browser)
+            results.put(None)  # this worker is done
+
+    pbar = tqdm(total=len(items), desc=f"{desc} ({workers} workers)", disable=not show_progress)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for index in range(workers):
+            executor.submit(worker, index)
+
+        try:
+            running = workers
+            while running:
+                result = results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                on_result(result)
+                pbar.update(1)
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+            while True:
+                try:
+                    result = results.get_nowait()
+                except queue.Empty:
+                    break
+                if result is not None:
+                    on_result(result)
+            pbar.close()
+
+    if not tasks.empty():
+        raise RuntimeError(
+            f"All browser workers stopped with {tasks.qsize()} of {len(items)} items unprocessed"
+        )
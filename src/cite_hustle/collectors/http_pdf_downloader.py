@@ -18,15 +18,22 @@ def doi_slug_filename(doi: str) -> str:
     return doi.replace("/", "_") + ".pdf"
 
 
-def download_pdf(url: str, dest_path: Path, timeout_s: float = 60.0) -> Tuple[bool, Optional[str]]:
+def download_pdf(
+    url: str,
+    dest_path: Path,
+    timeout_s: float = 60.0,
+    client: Optional[httpx.Client] = None,
+) -> Tuple[bool, Optional[str]]:
     """Stream a PDF to dest_path; validates the %PDF- magic bytes.
 
     Returns (success, error_message). Writes to a .part file first so an
-    interrupted download never leaves a truncated .pdf behind.
+    interrupted download never leaves a truncated .pdf behind. Pass a shared
+    client to reuse its pooled connections across downloads from one host.
     """
     tmp_path = dest_path.with_suffix(".part")
+    stream = client.stream if client is not None else httpx.stream
     try:
-        with httpx.stream(
+        with stream(
             "GET",
             url,
             timeout=timeout_s,
@@ -1,10 +1,12 @@
 """Journal registry for field-specific journals"""
 
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Journal:
     """Represents an academic journal"""
 
@@ -71,10 +73,29 @@ class JournalRegistry:
         Journal("JOURNAL OF MANAGEMENT", "0149-2063", "management", "SAGE"),
     ]
 
+    # The registry is static, so the derived collections are built once per
+    # class. The cached copies are immutable; the public getters hand each
+    # caller its own list or dict, so no caller can change another's view.
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _all_journals(cls) -> Tuple[Journal, ...]:
+        return tuple(cls.ACCOUNTING + cls.FINANCE + cls.ECONOMICS + cls.MANAGEMENT)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _journals_by_issn(cls) -> Mapping[str, Journal]:
+        return MappingProxyType({j.issn: j for j in cls._all_journals()})
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _issns(cls, field: str) -> Tuple[str, ...]:
+        return tuple(j.issn for j in cls.get_by_field(field))
+
     @classmethod
     def get_all_journals(cls) -> List[Journal]:
         """Get all journals across all fields"""
-        return cls.ACCOUNTING + cls.FINANCE + cls.ECONOMICS + cls.MANAGEMENT
+        return list(cls._all_journals())
 
     @classmethod
     def get_by_field(cls, field: str) -> List[Journal]:
@@ -104,7 +125,7 @@ class JournalRegistry:
         gets dropped from the dict. Raise loudly instead.
         """
         seen: Dict[str, Journal] = {}
-        for j in cls.get_all_journals():
+        for j in cls._all_journals():
             if j.issn in seen:
                 other = seen[j.issn]
                 raise ValueError(
@@ -116,12 +137,12 @@ class JournalRegistry:
     @classmethod
     def get_journal_dict(cls) -> Dict[str, Journal]:
         """Get dictionary of journals by ISSN"""
-        return {j.issn: j for j in cls.get_all_journals()}
+        return dict(cls._journals_by_issn())
 
     @classmethod
     def get_issn_list(cls, field: str = "all") -> List[str]:
         """Get list of ISSNs for a field"""
-        return [j.issn for j in cls.get_by_field(field)]
+        return list(cls._issns(field))
 
 
 # Fail fast at import time if two journals share an ISSN.
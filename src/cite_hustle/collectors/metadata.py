@@ -1,13 +1,20 @@
 """CrossRef metadata collector for academic articles"""
 
-import concurrent.futures
+import asyncio
+import gzip
 import html
+import itertools
 import json
+import os
 import re
+import sys
+import zlib
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
 from crossref_commons.iteration import iterate_publications_as_json
 from tenacity import retry, stop_after_attempt, wait_exponential
 from tqdm import tqdm
@@ -17,6 +24,10 @@ from cite_hustle.config import settings
 from cite_hustle.database.repository import ArticleRepository
 
 
+class CorruptedCacheError(Exception):
+    """Raised when a cache file turns out to be unreadable while it is streamed."""
+
+
 class MetadataCollector:
     """Collects article metadata from CrossRef API"""
 
@@ -54,10 +65,31 @@ class MetadataCollector:
         r"^volume \d+",  # "Volume 45 Issue 3"
         r"^issue \d+",  # "Issue 3"
     ]
+    # All patterns as one compiled alternation: one search per title
+    NON_ARTICLE_RE = re.compile("|".join(f"(?:{p})" for p in NON_ARTICLE_PATTERNS), re.IGNORECASE)
 
     # Valid CrossRef types for research articles
     VALID_TYPES = ["journal-article", "proceedings-article"]
 
+    # Transformed rows buffered across journal-years before one bulk INSERT
+    INSERT_BATCH_ROWS = 5000
+
+    CROSSREF_API_URL = "https://api.crossref.org/works"
+    # Maximum page size CrossRef allows with cursor-based deep paging
+    CROSSREF_ROWS = 1000
+    # Longest run of years fetched as one query. A range is cached only once it
+    # is complete, so this bounds the work an interrupted or failed fetch loses.
+    MAX_RANGE_YEARS = 5
+    # Request starts per second across all concurrent fetches, just under the
+    # 50/s CrossRef advertises for the polite pool. Replaced by the live
+    # X-Rate-Limit-* headers once the first response arrives.
+    CROSSREF_MAX_RPS = 45
+    # Fraction of the advertised rate limit actually used
+    RATE_LIMIT_HEADROOM = 0.9
+    # CrossRef JSON repeats the same keys in every item and compresses well even
+    # at a fast level; the cache syncs through Dropbox, so bytes matter more than CPU
+    CACHE_GZIP_LEVEL = 3
+
     def __init__(self, repo: ArticleRepository, cache_dir: Optional[Path] = None):
         """
         Initialize metadata collector
@@ -69,6 +101,9 @@ class MetadataCollector:
         self.repo = repo
         self.cache_dir = cache_dir or settings.cache_dir
         self.cache_dir.mkdir(exist_ok=True, parents=True)
+        # Earliest event-loop time the next CrossRef request may start
+        self._next_request_at = 0.0
+        self._request_interval = 1 / self.CROSSREF_MAX_RPS
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -84,17 +119,21 @@ class MetadataCollector:
         if not title:
             return title
 
-        # Use BeautifulSoup to remove HTML tags
-        soup = BeautifulSoup(title, "html.parser")
-        text = soup.get_text()
+        # Most CrossRef titles carry no markup: skip parsing, and return the
+        # string untouched unless its whitespace needs collapsing
+        if "<" not in title and "&" not in title:
+            if "  " not in title and title.isprintable() and title == title.strip():
+                return title
+            return " ".join(title.split())
+
+        # Remove HTML tags (lxml's parser decodes entities as it goes)
+        text = lxml.html.fragment_fromstring(title, create_parent="div").text_content()
 
-        # Decode HTML entities (e.g., &amp; -> &, &lt; -> <)
+        # Decode remaining HTML entities (e.g., double-escaped &amp;lt; -> <)
         text = html.unescape(text)
 
         # Clean up extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return " ".join(text.split())
 
     @classmethod
     def is_valid_article(cls, article: Dict) -> bool:
@@ -123,9 +162,8 @@ class MetadataCollector:
                 return False
 
         # Check regex patterns for more precise matching
-        for pattern in cls.NON_ARTICLE_PATTERNS:
-            if re.search(pattern, title, re.IGNORECASE):
-                return False
+        if cls.NON_ARTICLE_RE.search(title):
+            return False
 
         # Must have a DOI
         if not article.get("DOI"):
@@ -133,62 +171,222 @@ class MetadataCollector:
 
         return True
 
+    def _cache_file(self, issn: str, year: int) -> Path:
+        return self.cache_dir / f"cache_{issn}_{year}.jsonl.gz"
+
+    @staticmethod
+    def _iter_cache(cache_file: Path) -> Iterator[Dict]:
+        """Lazily read one year's cached items, one line at a time
+
+        A corrupted file is removed, so its year gets fetched again, and
+        CorruptedCacheError is raised; _buffer_articles then drops whatever
+        was already read of that year.
+        """
+        try:
+            with gzip.open(cache_file, "rb") as f:
+                for line in f:
+                    yield json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError, EOFError, OSError, zlib.error) as e:
+            cache_file.unlink(missing_ok=True)
+            raise CorruptedCacheError(str(cache_file)) from e
+
+    def _stream_years(self, issn: str, years: Iterable[int]) -> Dict[int, Iterator[Dict]]:
+        """Lazy item streams for years whose cache file exists"""
+        return {year: self._iter_cache(self._cache_file(issn, year)) for year in years}
+
+    @contextmanager
+    def _year_cache_writer(self, issn: str, year_from: int, year_to: int):
+        """Write fetched items into per-year cache files as they arrive
+
+        Yields a write(items) function that appends each item to its year's
+        file, so a range fetch never holds more than one page in memory. The
+        files are written under a .part name and renamed into place only once
+        the whole range was fetched; a failed fetch leaves no partial cache.
+        """
+        paths = {year: self._cache_file(issn, year) for year in range(year_from, year_to + 1)}
+        parts = {year: path.with_suffix(".part") for year, path in paths.items()}
+        try:
+            with ExitStack() as stack:
+                files = {
+                    year: stack.enter_context(gzip.open(part, "wb", compresslevel=self.CACHE_GZIP_LEVEL))
+                    for year, part in parts.items()
+                }
+
+                def write(items: Iterable[Dict]):
+                    for article in items:
+                        f = files.get(self._publication_year(article))
+                        if f is not None:
+                            # Compact, C-encoded, and UTF-8 rather than \u escapes
+                            line = json.dumps(article, ensure_ascii=False, separators=(",", ":"))
+                            f.write(line.encode("utf-8") + b"\n")
+
+                yield write
+        except BaseException:
+            for part in parts.values():
+                part.unlink(missing_ok=True)
+            raise
+        for year, part in parts.items():
+            part.replace(paths[year])
+
+    @classmethod
+    def _year_ranges(cls, years: List[int]) -> List[Tuple[int, int]]:
+        """Collapse years into (first, last) runs of at most MAX_RANGE_YEARS consecutive years"""
+        ranges: List[Tuple[int, int]] = []
+        for year in sorted(set(years)):
+            if (
+                ranges
+                and year == ranges[-1][1] + 1
+                and year - ranges[-1][0] < cls.MAX_RANGE_YEARS
+            ):
+                ranges[-1] = (ranges[-1][0], year)
+            else:
+                ranges.append((year, year))
+        return ranges
+
+    def _split_cached(self, issn: str, years: List[int]) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Years already cached, plus the (first, last) year ranges still to fetch"""
+        cached = []
+        uncached = []
+        for year in years:
+            if self._cache_file(issn, year).exists():
+                cached.append(year)
+            else:
+                uncached.append(year)
+        return cached, self._year_ranges(uncached)
+
+    @staticmethod
+    def _publication_year(article: Dict) -> Optional[int]:
+        """Year CrossRef's pub-date filters match on (published, else issued)"""
+        for field in ("published", "issued"):
+            parts = article.get(field, {}).get("date-parts") or [[None]]
+            if parts[0] and parts[0][0]:
+                return parts[0][0]
+        return None
+
+    def _log_fetch_failure(self, issn: str, year_from: int, year_to: int, error: Exception):
+        self.repo.bulk_log_processing(
+            [
+                (f"{issn}_{year}", "metadata_fetch", "failed", str(error))
+                for year in range(year_from, year_to + 1)
+            ]
+        )
+
     @retry(wait=wait_exponential(multiplier=1, min=4, max=10), stop=stop_after_attempt(3))
-    def fetch_articles_by_issn(self, year: int, issn: str) -> List[Dict]:
+    def _fetch_range(self, issn: str, year_from: int, year_to: int):
+        """Stream all CrossRef items for a journal published in [year_from, year_to] to the cache"""
+        filter_params = {
+            "issn": issn,
+            "from-pub-date": f"{year_from}-01-01",
+            "until-pub-date": f"{year_to}-12-31",
+        }
+        with self._year_cache_writer(issn, year_from, year_to) as write:
+            # iterate_publications_as_json stops after 1000 items unless told otherwise
+            write(iterate_publications_as_json(filter=filter_params, max_results=sys.maxsize))
+
+    def _fetch_year_range(
+        self, issn: str, year_from: int, year_to: int
+    ) -> Dict[int, Iterator[Dict]]:
         """
-        Fetch articles from CrossRef API for a specific journal and year
+        Fetch one uncached year range from CrossRef into the per-year cache
 
-        Args:
-            year: Publication year
-            issn: Journal ISSN
+        The range is one paginated query rather than one query per year; the
+        results go straight to cache files, and the returned streams read
+        them back lazily.
 
         Returns:
-            List of article dictionaries from CrossRef
+            Dictionary mapping year to an iterator over its CrossRef article
+            dictionaries, or an empty dictionary if the fetch failed
         """
-        cache_file = self.cache_dir / f"cache_{issn}_{year}.json"
-
-        # Check cache first
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                print(f"⚠️  Corrupted cache file, re-fetching: {cache_file}")
-                cache_file.unlink()
-
-        # Fetch from CrossRef API using new library
+        # Set email for polite API usage via environment variable (if provided)
+        if settings.crossref_email:
+            os.environ["CR_API_MAILTO"] = settings.crossref_email
+
+        try:
+            self._fetch_range(issn, year_from, year_to)
+        except Exception as e:
+            print(f"✗ Error fetching {issn} for {year_from}-{year_to}: {e}")
+            self._log_fetch_failure(issn, year_from, year_to, e)
+            return {}
+        return self._stream_years(issn, range(year_from, year_to + 1))
+
+    @retry(wait=wait_exponential(multiplier=1, min=4, max=10), stop=stop_after_attempt(3))
+    async def _fetch_page_async(self, client: httpx.AsyncClient, params: Dict) -> Dict:
+        """Fetch one cursor page from the CrossRef works endpoint"""
+        response = await client.get(self.CROSSREF_API_URL, params=params)
+        self._update_rate_limit(response.headers)
+        response.raise_for_status()
+        return response.json()["message"]
+
+    def _update_rate_limit(self, headers: httpx.Headers):
+        """Pace requests by the limit CrossRef advertises (e.g. 50 per "1s")"""
         try:
-            # Set email for polite API usage via environment variable (if provided)
-            import os
+            limit = int(headers["X-Rate-Limit-Limit"])
+            interval = float(headers["X-Rate-Limit-Interval"].rstrip("s"))
+        except (KeyError, ValueError):
+            return
+        if limit > 0 and interval > 0:
+            self._request_interval = interval / (limit * self.RATE_LIMIT_HEADROOM)
 
-            if settings.crossref_email:
-                os.environ["CR_API_MAILTO"] = settings.crossref_email
+    async def _pace_request(self):
+        """Space CrossRef request starts by the current rate limit across all fetches
 
-            filter_params = {
-                "issn": issn,
-                "from-pub-date": f"{year}-01-01",
-                "until-pub-date": f"{year}-12-31",
-            }
+        Every fetch runs on the one event loop, so no lock is needed.
+        """
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_request_at)
+        self._next_request_at = start + self._request_interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
-            # Collect all articles
-            articles = []
-            for article in iterate_publications_as_json(filter=filter_params):
-                articles.append(article)
+    async def fetch_articles_by_issn_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        issn: str,
+        year_from: int,
+        year_to: int,
+    ) -> Dict[int, Iterator[Dict]]:
+        """
+        Async counterpart of _fetch_year_range
 
-            # Cache the results
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(articles, f, indent=2)
+        Args:
+            client: Shared HTTP client
+            semaphore: Bounds the number of range fetches in flight
+            issn: Journal ISSN
+            year_from: First publication year
+            year_to: Last publication year (inclusive)
 
-            return articles
+        Returns:
+            Dictionary mapping year to an iterator over its CrossRef article
+            dictionaries, or an empty dictionary if the fetch failed
+        """
+        params = {
+            "filter": f"issn:{issn},from-pub-date:{year_from}-01-01,until-pub-date:{year_to}-12-31",
+            "rows": self.CROSSREF_ROWS,
+            "cursor": "*",
+        }
+        if settings.crossref_email:
+            params["mailto"] = settings.crossref_email
 
+        try:
+            async with semaphore:
+                with self._year_cache_writer(issn, year_from, year_to) as write:
+                    while True:
+                        await self._pace_request()
+                        message = await self._fetch_page_async(client, params)
+                        items = message.get("items", [])
+                        write(items)
+                        if len(items) < self.CROSSREF_ROWS:
+                            break
+                        params["cursor"] = message["next-cursor"]
         except Exception as e:
-            print(f"✗ Error fetching {issn} for {year}: {e}")
-            self.repo.log_processing(
-                doi=f"{issn}_{year}", stage="metadata_fetch", status="failed", error_message=str(e)
-            )
-            return []
+            tqdm.write(f"✗ Error fetching {issn} for {year_from}-{year_to}: {e}")
+            self._log_fetch_failure(issn, year_from, year_to, e)
+            return {}
 
-    def transform_articles(self, articles: List[Dict], journal: Journal) -> List[Dict]:
+        return self._stream_years(issn, range(year_from, year_to + 1))
+
+    def transform_articles(self, articles: Iterable[Dict], journal: Journal) -> List[Dict]:
         """
         Transform CrossRef article data into database format
 
@@ -273,50 +471,112 @@ class MetadataCollector:
             Total number of articles collected
         """
         total_articles = 0
+        rows: List[Dict] = []
+        collected: List[Tuple[str, int, int]] = []
 
-        iterator = tqdm(years, desc=f"Collecting {journal.name}") if show_progress else years
+        # Check if already processed (skip if force=True)
+        existing_counts = {} if force else self._existing_counts([journal], years)
 
-        for year in iterator:
-            # Check if already processed (skip if force=True)
+        missing = []
+        for year in years:
             if not force:
-                existing = self.repo.conn.execute(
-                    """
-                    SELECT COUNT(*) FROM articles
-                    WHERE journal_issn = ? AND year = ?
-                """,
-                    [journal.issn, year],
-                ).fetchone()[0]
+                existing = existing_counts.get((journal.issn, year), 0)
 
                 if existing > 0:
                     if show_progress:
                         tqdm.write(f"  ✓ {year}: {existing} articles already in database")
                     continue
+            missing.append(year)
+
+        # Fetch from CrossRef, one query per run of consecutive uncached years
+        cached, ranges = self._split_cached(journal.issn, missing)
+        batches = itertools.chain(
+            [(len(cached), self._stream_years(journal.issn, cached))],
+            (
+                (year_to - year_from + 1, self._fetch_year_range(journal.issn, year_from, year_to))
+                for year_from, year_to in ranges
+            ),
+        )
+
+        with tqdm(
+            total=len(missing), desc=f"Collecting {journal.name}", disable=not show_progress
+        ) as pbar:
+            for n_years, by_year in batches:
+                for year, articles in sorted(by_year.items()):
+                    count = self._buffer_articles(articles, journal, year, rows, collected)
+                    total_articles += count
+
+                    if count and show_progress:
+                        tqdm.write(f"  ✓ {year}: {count} articles collected")
+
+                if len(rows) >= self.INSERT_BATCH_ROWS:
+                    self._flush_articles(rows, collected)
+                pbar.update(n_years)
+
+        self._flush_articles(rows, collected)
+        return total_articles
 
-            # Fetch from CrossRef
-            articles = self.fetch_articles_by_issn(year, journal.issn)
-
-            if not articles:
-                continue
+    def _existing_counts(
+        self, journals: List[Journal], years: List[int]
+    ) -> Dict[Tuple[str, int], int]:
+        """Article counts per (issn, year) already in the database, in one query"""
+        if not journals or not years:
+            return {}
+        rows = self.repo.conn.execute(
+            """
+            SELECT journal_issn, year, COUNT(*) FROM articles
+            WHERE list_contains(?, journal_issn) AND year BETWEEN ? AND ?
+            GROUP BY journal_issn, year
+        """,
+            [[journal.issn for journal in journals], min(years), max(years)],
+        ).fetchall()
+        return {(issn, year): count for issn, year, count in rows}
+
+    def _buffer_articles(
+        self,
+        articles: Iterable[Dict],
+        journal: Journal,
+        year: int,
+        rows: List[Dict],
+        collected: List[Tuple[str, int, int]],
+    ) -> int:
+        """Transform one (journal, year) batch into the insert buffer; returns rows added
 
-            # Transform and save (with filtering)
+        The year is transformed apart from the buffer, so a cache file that
+        turns out to be corrupted partway through adds (and logs) nothing.
+        """
+        try:
             transformed = self.transform_articles(articles, journal)
+        except CorruptedCacheError as e:
+            tqdm.write(f"⚠️  Corrupted cache file, re-fetching {year} on the next run: {e}")
+            return 0
+        if not transformed:
+            return 0
 
-            if transformed:
-                self.repo.bulk_insert_articles(transformed)
-                total_articles += len(transformed)
+        rows.extend(transformed)
+        collected.append((journal.issn, year, len(transformed)))
+        return len(transformed)
 
-                # Log success
-                self.repo.log_processing(
-                    doi=f"{journal.issn}_{year}",
-                    stage="metadata_collect",
-                    status="success",
-                    error_message=f"Collected {len(transformed)} articles",
-                )
+    def _flush_articles(self, rows: List[Dict], collected: List[Tuple[str, int, int]]):
+        """Insert buffered rows in one statement, then log each journal-year they came from
 
-                if show_progress:
-                    tqdm.write(f"  ✓ {year}: {len(transformed)} articles collected")
+        The insert and its log rows share one transaction, so a flush is a
+        single commit and a journal-year is never logged without its articles.
+        """
+        with self.repo.transaction():
+            if rows:
+                self.repo.bulk_insert_articles(rows)
+
+            # Log success
+            self.repo.bulk_log_processing(
+                [
+                    (f"{issn}_{year}", "metadata_collect", "success", f"Collected {count} articles")
+                    for issn, year, count in collected
+                ]
+            )
 
-        return total_articles
+        rows.clear()
+        collected.clear()
 
     def collect_for_journals(
         self,
@@ -369,21 +629,24 @@ class MetadataCollector:
         force: bool = False,
     ) -> Dict[str, int]:
         """
-        Collect articles for multiple journals with true parallelism
+        Collect articles for multiple journals with concurrent CrossRef requests
+
+        All (journal, year) fetches share one async HTTP client; at most
+        max_workers of them are in flight at once. Transformed rows are buffered
+        and written to the database in large batches.
 
         Note: Use with caution as this may hit API rate limits
 
         Args:
             journals: List of journals to collect
             years: List of years to collect
-            max_workers: Number of parallel workers
+            max_workers: Maximum concurrent CrossRef fetches
             force: If True, bypass the "already in database" check and re-fetch
 
         Returns:
             Dictionary mapping journal name to article count
         """
         max_workers = max_workers or settings.max_workers
-        results = {}
 
         print(f"📚 Collecting metadata (parallel mode)")
         print(f"Journals: {len(journals)} | Years: {len(years)} | Workers: {max_workers}")
@@ -392,23 +655,62 @@ class MetadataCollector:
         else:
             print()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.collect_for_journal, journal, years, False, force): journal
-                for journal in journals
-            }
-
-            with tqdm(total=len(journals), desc="Processing journals") as pbar:
-                for future in concurrent.futures.as_completed(futures):
-                    journal = futures[future]
-                    try:
-                        count = future.result()
-                        results[journal.name] = count
-                        pbar.set_postfix_str(f"{journal.name}: {count} articles")
-                    except Exception as e:
-                        print(f"\n✗ Error processing {journal.name}: {e}")
-                        results[journal.name] = 0
-                    finally:
-                        pbar.update(1)
-
+        existing_counts = {} if force else self._existing_counts(journals, years)
+        pending = [
+            (journal, year)
+            for journal in journals
+            for year in years
+            if (journal.issn, year) not in existing_counts
+        ]
+
+        results = {journal.name: 0 for journal in journals}
+        if pending:
+            asyncio.run(self._collect_async(pending, max_workers, results))
         return results
+
+    async def _collect_async(
+        self, pending: List[Tuple[Journal, int]], max_workers: int, results: Dict[str, int]
+    ):
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(journal: Journal, year_from: int, year_to: int):
+            by_year = await self.fetch_articles_by_issn_async(
+                client, semaphore, journal.issn, year_from, year_to
+            )
+            return journal, year_to - year_from + 1, by_year
+
+        rows: List[Dict] = []
+        collected: List[Tuple[str, int, int]] = []
+
+        years_by_journal: Dict[Journal, List[int]] = {}
+        for journal, year in pending:
+            years_by_journal.setdefault(journal, []).append(year)
+
+        headers = {"User-Agent": "cite-hustle/0.1 (CrossRef metadata collection)"}
+        with tqdm(total=len(pending), desc="Fetching journal-years") as pbar:
+
+            def record(journal: Journal, by_year: Dict[int, Iterator[Dict]]):
+                for year, articles in sorted(by_year.items()):
+                    count = self._buffer_articles(articles, journal, year, rows, collected)
+                    results[journal.name] += count
+                    pbar.set_postfix_str(f"{journal.name} {year}: {count} articles")
+                if len(rows) >= self.INSERT_BATCH_ROWS:
+                    self._flush_articles(rows, collected)
+
+            # Cached years need no request; the rest become one task per run of
+            # consecutive years per journal
+            ranges = []
+            for journal, years in years_by_journal.items():
+                cached, uncached = self._split_cached(journal.issn, years)
+                record(journal, self._stream_years(journal.issn, cached))
+                pbar.update(len(cached))
+                ranges.extend((journal, year_from, year_to) for year_from, year_to in uncached)
+
+            async with httpx.AsyncClient(timeout=60.0, headers=headers) as client:
+                tasks = [fetch(journal, first, last) for journal, first, last in ranges]
+                for next_done in asyncio.as_completed(tasks):
+                    journal, n_years, by_year = await next_done
+                    record(journal, by_year)
+                    pbar.update(n_years)
+
+        self._flush_articles(rows, collected)
@@ -18,9 +18,9 @@ Download" button; those are reported as ``unavailable`` so they are skipped on
 later runs instead of being retried forever.
 """
 
-import time
 import random
 import shutil
+import time
 from pathlib import Path
 from typing import Optional, Dict, List, Callable
 import undetected_chromedriver as uc
@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from tqdm import tqdm
 
+from cite_hustle.collectors.browser_pool import STARTUP_LOCK, run_browser_pool
+
 
 class SeleniumPDFDownloader:
     """Download PDFs from SSRN using a real browser session."""
@@ -42,6 +44,7 @@ class SeleniumPDFDownloader:
         download_timeout: int = 60,
         page_timeout: int = 30,
         restart_every: int = 40,
+        temp_dir_name: str = "temp_downloads",
     ):
         """
         Args:
@@ -53,6 +56,8 @@ class SeleniumPDFDownloader:
             page_timeout: Max seconds to wait for page elements
             restart_every: Recreate the browser after this many papers to keep
                 long unattended runs stable (0 disables).
+            temp_dir_name: Download folder under storage_dir; parallel workers
+                each need their own so downloads can be told apart.
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -63,11 +68,12 @@ class SeleniumPDFDownloader:
         self.restart_every = restart_every
 
         # Downloads land in a temp folder, then get renamed to <doi>.pdf
-        self.temp_download_dir = self.storage_dir / "temp_downloads"
+        self.temp_download_dir = self.storage_dir / temp_dir_name
         self.temp_download_dir.mkdir(parents=True, exist_ok=True)
 
         self.driver = None
         self.cookies_accepted = False
+        self._since_restart = 0
 
     # ── Browser lifecycle ──────────────────────────────────────────────────
 
@@ -97,7 +103,8 @@ class SeleniumPDFDownloader:
         if chrome_major is not None:
             kwargs["version_main"] = chrome_major
 
-        self.driver = uc.Chrome(**kwargs)
+        with STARTUP_LOCK:
+            self.driver = uc.Chrome(**kwargs)
         self.cookies_accepted = False
         if self.headless:
             print("  ⚠️  Headless mode is blocked by SSRN's Cloudflare; use visible mode.")
@@ -145,15 +152,18 @@ class SeleniumPDFDownloader:
 
         Returns True if the real page loaded, False if still challenged.
         """
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            time.sleep(2)
+
+        def cleared(driver) -> bool:
             try:
-                if "just a moment" not in self.driver.page_source.lower():
-                    return True
+                return "just a moment" not in driver.page_source.lower()
             except WebDriverException:
-                pass
-        return False
+                return False
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=1).until(cleared)
+            return True
+        except TimeoutException:
+            return False
 
     def accept_cookies(self, timeout: int = 8):
         """Accept the OneTrust cookie banner once (its overlay blocks clicks)."""
@@ -164,11 +174,25 @@ class SeleniumPDFDownloader:
                 EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
             ).click()
             print("  ✓ Accepted cookies")
-            time.sleep(1)
+            # Proceed as soon as the overlay is gone rather than after a fixed pause
+            WebDriverWait(self.driver, 5).until(
+                EC.invisibility_of_element_located((By.ID, "onetrust-accept-btn-handler"))
+            )
         except TimeoutException:
             pass  # no banner this session
         self.cookies_accepted = True
 
+    def _wait_for_download_control(self, timeout: int = 5):
+        """Wait until the download button (enabled or not) has rendered."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "a[href*='Delivery.cfm'], a[class*='no-availab']")
+                )
+            )
+        except TimeoutException:
+            pass  # _find_download_button decides what a missing control means
+
     def _find_download_button(self):
         """Return (element, available) for the SSRN download control.
 
@@ -229,7 +253,7 @@ class SeleniumPDFDownloader:
                 return result
 
             self.accept_cookies()
-            time.sleep(1)
+            self._wait_for_download_control()
 
             button, available = self._find_download_button()
             if available is False:
@@ -299,72 +323,157 @@ class SeleniumPDFDownloader:
 
     # ── Batch ──────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _failed_result(item: Dict, error: Exception) -> Dict:
+        """Result for a queued paper whose download raised."""
+        return {
+            "doi": item["doi"],
+            "ssrn_url": item.get("ssrn_url"),
+            "filepath": None,
+            "success": False,
+            "status": "failed",
+            "error": str(error),
+        }
+
+    def _download_item(self, item: Dict) -> Dict:
+        """Download one queued paper, restarting the browser if it died."""
+        try:
+            return self.download_pdf(item.get("ssrn_url"), item["doi"])
+        except WebDriverException as e:
+            # Browser died; rebuild it and record this one as failed
+            print(f"  ⚠️  Browser error ({type(e).__name__}); restarting browser")
+            self.quit()
+            self.setup_webdriver()
+            self._since_restart = 0
+            return self._failed_result(item, e)
+
+    def _after_item(self, result: Dict) -> float:
+        """Recycle the browser when due; returns the pause before the next paper."""
+        # Periodically recycle the browser on long runs
+        self._since_restart += 1
+        if self.restart_every and self._since_restart >= self.restart_every:
+            print(f"  ↻ Recycling browser after {self._since_restart} papers")
+            self.quit()
+            self.setup_webdriver()
+            self._since_restart = 0
+
+        # Polite, jittered delay between papers; a file already on disk made
+        # no request, so there is nothing to space out
+        if self.delay <= 0 or result["status"] == "skipped":
+            return 0.0
+        return random.uniform(self.delay * 0.6, self.delay * 1.4)
+
+    def _cleanup(self):
+        """Close the browser and remove this downloader's temp folder."""
+        self.quit()
+        try:
+            if self.temp_download_dir.exists():
+                shutil.rmtree(self.temp_download_dir)
+        except Exception:
+            pass
+
+    def _spawn_worker(self, index: int) -> "SeleniumPDFDownloader":
+        """Create a downloader with the same settings but its own browser and temp folder."""
+        return SeleniumPDFDownloader(
+            storage_dir=self.storage_dir,
+            delay=self.delay,
+            headless=self.headless,
+            download_timeout=self.download_timeout,
+            page_timeout=self.page_timeout,
+            restart_every=self.restart_every,
+            temp_dir_name=f"temp_downloads_{index}",
+        )
+
     def download_batch(
         self,
         pdf_list: List[Dict],
         show_progress: bool = True,
         on_result: Optional[Callable[[Dict], None]] = None,
+        workers: int = 1,
     ) -> List[Dict]:
-        """Download multiple PDFs in one browser session.
+        """Download multiple PDFs, reusing each browser session across papers.
 
         Args:
             pdf_list: dicts with ``doi`` and ``ssrn_url`` keys
             show_progress: show a tqdm progress bar
             on_result: optional callback invoked after each paper with its
                 result dict. Use this to persist progress incrementally so an
-                interrupted overnight run loses at most one paper.
+                interrupted overnight run loses at most one paper. It is
+                always called from the calling thread.
+            workers: number of browser windows downloading in parallel
+
+        Raises:
+            RuntimeError: if every browser window failed with papers left
+                (on_result has already seen every result produced)
         """
+        if workers > 1 and len(pdf_list) > 1:
+            return self._download_batch_parallel(pdf_list, workers, show_progress, on_result)
+
         results = []
         self.setup_webdriver()
+        self._since_restart = 0
 
         try:
             iterator = tqdm(pdf_list, desc="Downloading PDFs") if show_progress else pdf_list
-            since_restart = 0
-
-            for item in pdf_list if not show_progress else iterator:
-                doi = item["doi"]
-                ssrn_url = item.get("ssrn_url")
-                (tqdm.write if show_progress else print)(f"\nDownloading: {doi}")
-
-                try:
-                    result = self.download_pdf(ssrn_url, doi)
-                except WebDriverException as e:
-                    # Browser died; rebuild it and record this one as failed
-                    print(f"  ⚠️  Browser error ({type(e).__name__}); restarting browser")
-                    self.quit()
-                    self.setup_webdriver()
-                    since_restart = 0
-                    result = {
-                        "doi": doi,
-                        "ssrn_url": ssrn_url,
-                        "filepath": None,
-                        "success": False,
-                        "status": "failed",
-                        "error": str(e),
-                    }
+
+            for item in iterator:
+                (tqdm.write if show_progress else print)(f"\nDownloading: {item['doi']}")
+                result = self._download_item(item)
 
                 results.append(result)
                 if on_result:
                     on_result(result)
 
-                # Polite, jittered delay between papers
-                if self.delay > 0:
-                    time.sleep(random.uniform(self.delay * 0.6, self.delay * 1.4))
-
-                # Periodically recycle the browser on long runs
-                since_restart += 1
-                if self.restart_every and since_restart >= self.restart_every:
-                    print(f"  ↻ Recycling browser after {since_restart} papers")
-                    self.quit()
-                    self.setup_webdriver()
-                    since_restart = 0
+                pause = self._after_item(result)
+                if pause:
+                    time.sleep(pause)
         finally:
-            self.quit()
-            try:
-                if self.temp_download_dir.exists():
-                    shutil.rmtree(self.temp_download_dir)
-            except Exception:
-                pass
+            self._cleanup()
+
+        self._print_summary(results)
+        return results
+
+    def _download_batch_parallel(
+        self,
+        pdf_list: List[Dict],
+        workers: int,
+        show_progress: bool,
+        on_result: Optional[Callable[[Dict], None]],
+    ) -> List[Dict]:
+        """Download with several browser windows pulling from one shared work queue.
+
+        Each worker thread drives its own Chrome instance, download folder and
+        delay. on_result (and with it every database write) runs on the
+        calling thread only.
+        """
+        results: List[Dict] = []
+
+        def download(downloader: "SeleniumPDFDownloader", item: Dict):
+            print(f"\nDownloading: {item['doi']}")
+            result = downloader._download_item(item)
+            return result, downloader._after_item(result)
+
+        def record(result: Dict):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        try:
+            run_browser_pool(
+                pdf_list,
+                workers,
+                spawn=self._spawn_worker,
+                process=download,
+                close=SeleniumPDFDownloader._cleanup,
+                failed=self._failed_result,
+                on_result=record,
+                desc="Downloading PDFs",
+                show_progress=show_progress,
+            )
+        finally:
+            # The coordinating downloader never opened a browser; drop its
+            # unused temp folder
+            self._cleanup()
 
         self._print_summary(results)
         return results
@@ -0,0 +1,153 @@
+"""Abstract extraction from saved or live SSRN paper page HTML"""
+
+import html
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+# Fast path: SSRN pages keep the abstract in <div class="abstract-text">...</div>
+ABSTRACT_DIV_RE = re.compile(
+    r'<div[^>]*\bclass="(?:[^"]*\s)?abstract-text(?:\s[^"]*)?"[^>]*>(.*?)</div>',
+    re.DOTALL | re.IGNORECASE,
+)
+PARAGRAPH_RE = re.compile(r'<p(?:\s[^>]*)?>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+ABSTRACT_HEADER_RE = re.compile(r'^Abstract\s*')
+
+
+def _strip_tags(fragment: str) -> str:
+    """Drop tags, decode entities and collapse whitespace in an HTML fragment"""
+    text = html.unescape(TAG_RE.sub(' ', fragment))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def extract_abstract_fast(html_content: str) -> Optional[str]:
+    """
+    Pull the abstract out of the div.abstract-text block with regexes only.
+
+    Returns None (so the caller falls back to full parsing) when the block is
+    missing or contains nested divs the non-greedy match could cut short.
+    """
+    match = ABSTRACT_DIV_RE.search(html_content)
+    if not match or '<div' in match.group(1).lower():
+        return None
+
+    block = match.group(1)
+    paragraphs = PARAGRAPH_RE.findall(block) or [block]
+    text = " ".join(t for t in (_strip_tags(p) for p in paragraphs) if t)
+    return text or None
+
+
+def extract_abstract_from_html(html_content: str) -> Optional[str]:
+    """
+    Extract abstract from SSRN HTML using multiple strategies with BeautifulSoup
+
+    A regex fast path handles the common div.abstract-text layout; the page is
+    only parsed into a DOM when that misses.
+
+    Args:
+        html_content: HTML content of SSRN paper page
+
+    Returns:
+        Abstract text or None if not found
+    """
+    abstract = extract_abstract_fast(html_content)
+    if abstract and len(abstract) > 50:
+        return _clean_abstract(abstract)
+
+    soup = BeautifulSoup(html_content, 'lxml')
+
+    for strategy, target in PARSE_STRATEGIES:
+        try:
+            abstract = strategy(soup, target)
+        except Exception:
+            # Strategy failed, try next one
+            continue
+        if abstract and len(abstract.strip()) > 50:  # Minimum reasonable length
+            return _clean_abstract(abstract)
+
+    return None
+
+
+def _clean_abstract(abstract: str) -> str:
+    """Trim whitespace and a leading "Abstract" header"""
+    return ABSTRACT_HEADER_RE.sub('', abstract.strip()).strip()
+
+
+def extract_by_class(soup: BeautifulSoup, class_name: str) -> Optional[str]:
+    """Extract abstract from element with specific class"""
+    div = soup.find('div', class_=class_name)
+    if div:
+        # Try to get paragraphs
+        paragraphs = div.find_all('p')
+        if paragraphs:
+            text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+            return text if text else None
+        # Otherwise get all text
+        return div.get_text(strip=True)
+    return None
+
+
+def extract_after_header(soup: BeautifulSoup, header_text: str) -> Optional[str]:
+    """Find header with text, then extract following paragraphs"""
+    # Find all h3 tags
+    for h3 in soup.find_all('h3'):
+        if header_text.lower() in h3.get_text().lower():
+            # Get parent element
+            parent = h3.parent
+            if parent:
+                paragraphs = parent.find_all('p')
+                if paragraphs:
+                    text = " ".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+                    return text if text else None
+    return None
+
+
+def extract_by_class_partial(soup: BeautifulSoup, partial_class: str) -> Optional[str]:
+    """Find div with class containing partial match"""
+    for div in soup.find_all('div'):
+        if div.get('class'):
+            classes = ' '.join(div.get('class'))
+            if partial_class.lower() in classes.lower():
+                text = div.get_text(strip=True)
+                # Remove "Abstract" header
+                text = text.replace('Abstract\n', '').replace('Abstract', '').strip()
+                return text if len(text) > 50 else None
+    return None
+
+
+def extract_by_text_search(soup: BeautifulSoup, search_text: str) -> Optional[str]:
+    """Search for text and extract following content"""
+    # Find all elements containing "Abstract"
+    for elem in soup.find_all(string=lambda text: text and search_text in text):
+        parent = elem.parent
+        if parent:
+            # Get all following siblings
+            paragraphs = []
+            for sibling in parent.find_next_siblings():
+                if sibling.name == 'p':
+                    paragraphs.append(sibling.get_text(strip=True))
+                elif sibling.name in ['h1', 'h2', 'h3', 'h4']:
+                    # Stop at next header
+                    break
+
+            if paragraphs:
+                text = " ".join(paragraphs)
+                return text if text else None
+
+    return None
+
+
+# DOM strategies tried in order once the fast path misses: (function, argument)
+PARSE_STRATEGIES = (
+    # Strategy 1: div.abstract-text with paragraphs
+    (extract_by_class, "abstract-text"),
+    # Strategy 2: Find Abstract h3, get parent, extract paragraphs
+    (extract_after_header, "Abstract"),
+    # Strategy 3: Any div with class containing "abstract"
+    (extract_by_class_partial, "abstract"),
+    # Strategy 4: Find "Abstract" text, get next siblings
+    (extract_by_text_search, "Abstract"),
+)
@@ -10,11 +10,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from rapidfuzz import fuzz
 from tqdm import tqdm
 
+from cite_hustle.collectors.browser_pool import STARTUP_LOCK, run_browser_pool
+from cite_hustle.collectors.ssrn_html import extract_abstract_from_html
 from cite_hustle.config import settings
-from cite_hustle.matching import combined_similarity
+from cite_hustle.matching import combined_similarity, score_candidates
 from cite_hustle.database.repository import ArticleRepository
 
 
@@ -48,10 +49,52 @@ SESSION_PROFILES = [
     },
 ]
 
+# Page locators, built once and shared by every scrape and worker
+SSRN_SEARCH_URL = "https://papers.ssrn.com/sol3/DisplayAbstractSearch.cfm"
+COOKIE_BUTTON = (By.ID, "onetrust-accept-btn-handler")
+SEARCH_BOX = (By.ID, "term")
+TITLE_ONLY_LABEL = (By.XPATH, "//label[contains(., 'Title Only')]")
+SEARCH_BUTTONS = [
+    # Primary: button with inner span label-text "Search" (current advanced search UI)
+    (By.XPATH, "//button[.//span[@data-inner-style-target='label-text' and normalize-space()='Search']][not(ancestor::header)]"),
+    # Fallback: any button with visible text "Search" outside the header
+    (By.XPATH, "//button[normalize-space()='Search' and not(ancestor::header)]"),
+    # Fallback: generic aria-label, but again avoid header area
+    (By.XPATH, "//button[@aria-label='Search' and not(ancestor::header)]"),
+]
+RESULT_LINKS_CSS = "h3[data-component='Typography'] a"
+RESULT_LINKS = (By.CSS_SELECTOR, RESULT_LINKS_CSS)
+NO_RESULTS = (By.XPATH, "//h3[@data-component='Typography' and normalize-space()='No results.']")
+
+# Webfonts and media are never needed to read titles and abstracts. Images are
+# already off via Chrome prefs; stylesheets stay on because the clickable-element
+# waits and the Cloudflare challenge rely on real layout.
+BLOCKED_RESOURCE_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+]
+
+# Selenium polls every 0.5s by default, which adds up to half a second of idle
+# time to every wait that succeeds on a fast page
+WAIT_POLL_SECONDS = 0.1
+
+
+def _document_parsed(driver) -> bool:
+    """Wait predicate: "interactive" matches the eager page-load strategy"""
+    return driver.execute_script("return document.readyState") != "loading"
+
+
+def _results_or_no_results(driver) -> bool:
+    """Wait predicate: either result links or the "No results." heading rendered"""
+    return bool(driver.find_elements(*RESULT_LINKS) or driver.find_elements(*NO_RESULTS))
+
 
 class SSRNScraper:
     """Scrapes SSRN to find papers and extracting abstracts using direct URLs"""
 
+    # Scraped articles buffered before one batched write to ssrn_pages/processing_log
+    WRITE_BATCH_SIZE = 25
+
     def __init__(self, repo: ArticleRepository,
                  crawl_delay: int = 35,
                  similarity_threshold: int = 85,
@@ -138,6 +181,20 @@ class SSRNScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument(f"--lang={profile['languages'][0]}")
 
+        # Only the DOM text is scraped, so skip image downloads and background
+        # traffic. Cookies must stay enabled: Cloudflare clearance depends on them.
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+        # Return from get() at DOMContentLoaded instead of waiting for every ad and
+        # analytics beacon to fire load; the explicit element waits cover the rest
+        chrome_options.page_load_strategy = "eager"
+
         # Randomize window size within the profile's envelope
         min_w, max_w, min_h, max_h = profile["window_bounds"]
         width = random.randint(min_w, max_w)
@@ -157,11 +214,13 @@ class SSRNScraper:
             kwargs["version_main"] = chrome_major
 
         # Initialize undetected-chromedriver
-        self.driver = uc.Chrome(**kwargs)
+        with STARTUP_LOCK:
+            self.driver = uc.Chrome(**kwargs)
         version_label = f"chrome v{chrome_major}" if chrome_major is not None else "chrome version auto"
         print(f"  ✓ undetected-chromedriver started (profile: {profile['name']}, {version_label})")
 
         self._apply_session_overrides()
+        self._block_heavy_resources()
         return self.driver
 
     @staticmethod
@@ -224,6 +283,16 @@ class SSRNScraper:
         except Exception as e:
             print(f"  ℹ️  Could not patch navigator properties: {type(e).__name__}: {e}")
 
+    def _block_heavy_resources(self):
+        """Stop the browser from downloading fonts and media on every page."""
+        if not self.driver:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+        except Exception as e:
+            print(f"  ℹ️  Could not block fonts/media: {type(e).__name__}: {e}")
+
     def _human_pause(self, base_seconds: float, jitter: float = 0.5):
         """Sleep for a realistic interval around the requested duration."""
         base_seconds = max(0.0, base_seconds)
@@ -250,6 +319,15 @@ class SSRNScraper:
 
         return base
 
+    def _remaining_delay(self, started: float) -> float:
+        """
+        Variable crawl delay minus the time already spent on the current article.
+
+        Slow page loads count toward the pause, so a scrape that took longer
+        than the drawn delay moves straight on to the next article.
+        """
+        return self._get_next_delay() - (time.monotonic() - started)
+
     def _respect_crawl_delay(self):
         """Enforce crawl delay between top-level navigations with jitter."""
         if self.crawl_delay <= 0 or self._last_navigation == 0.0:
@@ -311,7 +389,7 @@ class SSRNScraper:
                 cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
                 if '__cf_bm' in cookies or 'cf_clearance' in cookies:
                     print("  ✓ Cloudflare cookie acquired! Challenge passed.")
-                    time.sleep(2)  # Extra buffer for page to fully load
+                    self._wait_for_document_ready()
                     return True
             except Exception as e:
                 print(f"  ℹ️  Cookie check error: {type(e).__name__}")
@@ -321,6 +399,16 @@ class SSRNScraper:
         print(f"  ✗ Cloudflare clearance timeout after {timeout}s")
         return False
 
+    def _wait_for_document_ready(self, timeout: int = 10):
+        """Wait for the page the challenge redirected to to finish parsing."""
+        try:
+            # DOM parsed, subresources possibly still loading
+            WebDriverWait(self._get_driver(), timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+                _document_parsed
+            )
+        except TimeoutException:
+            pass  # carry on; element waits downstream still apply
+
     def _is_cloudflare_or_blocked_page(self) -> Tuple[bool, Optional[str]]:
         """
         Detect if current page is a Cloudflare challenge or IP block page.
@@ -397,7 +485,7 @@ class SSRNScraper:
         try:
             drv = self._get_driver()
             cookie_button = WebDriverWait(drv, timeout).until(
-                EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler"))
+                EC.element_to_be_clickable(COOKIE_BUTTON)
             )
             self._human_pause(0.8, jitter=0.5)
             cookie_button.click()
@@ -421,6 +509,16 @@ class SSRNScraper:
         """
         return combined_similarity(db_title, result_title, self.length_similarity_weight)
 
+    def _on_search_page(self, search_url: str) -> bool:
+        """True if the browser is still on the search page with its form present."""
+        try:
+            drv = self._get_driver()
+            return drv.current_url.startswith(search_url) and bool(
+                drv.find_elements(*SEARCH_BOX)
+            )
+        except WebDriverException:
+            return False
+
     def search_ssrn_and_extract_urls(self, title: str, timeout: int = 10) -> Tuple[bool, Optional[str], List[Tuple[str, str, str]]]:
         """
         Search for a title on SSRN and extract URLs directly from search results.
@@ -434,13 +532,18 @@ class SSRNScraper:
             Tuple of (success, error_message, results_list)
             results_list contains: [(url, title, abstract_snippet), ...]
         """
-        ssrn_url = "https://papers.ssrn.com/sol3/DisplayAbstractSearch.cfm"
-
         try:
-            # Navigate to SSRN search page with Cloudflare challenge handling
-            print(f"  → Navigating to SSRN search page...")
-            if not self._handle_cloudflare_challenge(ssrn_url):
-                return False, "Could not bypass Cloudflare challenge on search page", []
+            if self._on_search_page(SSRN_SEARCH_URL):
+                # The previous query ended on the search page (no results / no match):
+                # reuse its form instead of reloading the page
+                print(f"  → Reusing SSRN search form on current page...")
+                self._respect_crawl_delay()
+                self._last_navigation = time.time()
+            else:
+                # Navigate to SSRN search page with Cloudflare challenge handling
+                print(f"  → Navigating to SSRN search page...")
+                if not self._handle_cloudflare_challenge(SSRN_SEARCH_URL):
+                    return False, "Could not bypass Cloudflare challenge on search page", []
 
             # Accept cookies on first search
             self.accept_cookies(timeout)
@@ -449,8 +552,8 @@ class SSRNScraper:
             print(f"  → Waiting for search box...")
 
             # On the advanced search page, the search box is directly visible with id="term"
-            search_box = WebDriverWait(self._get_driver(), timeout).until(
-                EC.element_to_be_clickable((By.ID, "term"))
+            search_box = WebDriverWait(self._get_driver(), timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+                EC.element_to_be_clickable(SEARCH_BOX)
             )
             print(f"  → Filling search box...")
             search_box.click()
@@ -472,8 +575,8 @@ class SSRNScraper:
             # Select "Title Only" search scope for better accuracy
             try:
                 print(f"  → Selecting 'Title Only' search scope...")
-                title_radio = WebDriverWait(self._get_driver(), 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//label[contains(., 'Title Only')]"))
+                title_radio = WebDriverWait(self._get_driver(), 5, poll_frequency=WAIT_POLL_SECONDS).until(
+                    EC.element_to_be_clickable(TITLE_ONLY_LABEL)
                 )
                 title_radio.click()
                 self._human_pause(0.3, 0.3)
@@ -484,29 +587,23 @@ class SSRNScraper:
             print(f"    Clicking form search button...")
             drv = self._get_driver()
 
-            # Try a small sequence of locator strategies to handle layout variations
-            search_locators = [
-                # Primary: button with inner span label-text "Search" (current advanced search UI)
-                (By.XPATH, "//button[.//span[@data-inner-style-target='label-text' and normalize-space()='Search']][not(ancestor::header)]"),
-                # Fallback: any button with visible text "Search" outside the header
-                (By.XPATH, "//button[normalize-space()='Search' and not(ancestor::header)]"),
-                # Fallback: generic aria-label, but again avoid header area
-                (By.XPATH, "//button[@aria-label='Search' and not(ancestor::header)]"),
-            ]
+            # A reused form still shows the previous query's result links or its
+            # "No results." heading. Remember one so the result wait below only
+            # accepts markup rendered for this query.
+            previous_marker = next(
+                iter(drv.find_elements(*RESULT_LINKS) or drv.find_elements(*NO_RESULTS)), None
+            )
 
+            # Wait for any of the locator strategies at once (checked in priority
+            # order on each poll) instead of one full timeout per missing layout
             search_button = None
             last_error: Optional[Exception] = None
-            for by, locator in search_locators:
-                try:
-                    print(f"    → Trying search button locator: {by} = {locator}")
-                    candidate = WebDriverWait(drv, timeout).until(
-                        EC.element_to_be_clickable((by, locator))
-                    )
-                    search_button = candidate
-                    break
-                except Exception as e:
-                    last_error = e
-                    continue
+            try:
+                search_button = WebDriverWait(drv, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+                    EC.any_of(*(EC.element_to_be_clickable(locator) for locator in SEARCH_BUTTONS))
+                )
+            except Exception as e:
+                last_error = e
 
             if search_button is not None:
                 try:
@@ -534,12 +631,21 @@ class SSRNScraper:
             print(f"   Waiting for search results or 'No results' message...")
             drv = self._get_driver()
 
-            try:
-                WebDriverWait(drv, timeout).until(
-                    lambda d: (
-                        d.find_elements(By.CSS_SELECTOR, "h3[data-component='Typography'] a")
-                        or d.find_elements(By.XPATH, "//h3[@data-component='Typography' and normalize-space()='No results.']")
+            if previous_marker is not None:
+                try:
+                    WebDriverWait(drv, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+                        EC.staleness_of(previous_marker)
                     )
+                except TimeoutException:
+                    # The old results never went away, so this search may not have
+                    # run. Leave the page so a retry starts from a fresh search form.
+                    print("   Previous search results did not refresh; reloading for retry.")
+                    drv.get("about:blank")
+                    return False, "Failed to search SSRN: previous results did not refresh", []
+
+            try:
+                WebDriverWait(drv, timeout, poll_frequency=WAIT_POLL_SECONDS).until(
+                    _results_or_no_results
                 )
             except TimeoutException as e:
                 # Nothing appeared in time; treat as no results for this title
@@ -547,7 +653,7 @@ class SSRNScraper:
                 return True, "No results (timeout)", []
 
             # Check if this search explicitly returned "No results."
-            no_result_elems = drv.find_elements(By.XPATH, "//h3[@data-component='Typography' and normalize-space()='No results.']")
+            no_result_elems = drv.find_elements(*NO_RESULTS)
             if no_result_elems:
                 print("   SSRN reports 'No results.' for this query; moving on without retries.")
                 return True, "No results", []
@@ -559,24 +665,23 @@ class SSRNScraper:
             print(f"   Extracting paper URLs from search results...")
             results = []
 
-            # Re-fetch elements to avoid stale element reference issues
-            result_elements = drv.find_elements(By.CSS_SELECTOR, "h3[data-component='Typography'] a")
-            print(f"   Found {len(result_elements)} result elements")
-
-            for idx, element in enumerate(result_elements):
-                try:
-                    paper_title = element.text.strip()
-                    paper_url = element.get_attribute('href')
-
-                    if paper_url and paper_title:
-                        # We'll get the full abstract from the paper page later
-                        results.append((paper_url, paper_title, ""))
-                    else:
-                        print(f"  ⚠️  Result {idx}: Missing title or URL (title={bool(paper_title)}, url={bool(paper_url)})")
-                except Exception as e:
-                    # Skip individual result if there's an error
-                    print(f"  ⚠️  Error extracting result {idx}: {type(e).__name__}: {str(e)}")
-                    continue
+            # Read every result's title and href in one browser round-trip instead of
+            # two WebDriver calls per element (also avoids stale element references)
+            result_links = drv.execute_script(
+                """
+                return Array.from(document.querySelectorAll(arguments[0]))
+                    .map(a => [(a.innerText || '').trim(), a.href || null]);
+                """,
+                RESULT_LINKS_CSS,
+            ) or []
+            print(f"   Found {len(result_links)} result elements")
+
+            for idx, (paper_title, paper_url) in enumerate(result_links):
+                if paper_url and paper_title:
+                    # We'll get the full abstract from the paper page later
+                    results.append((paper_url, paper_title, ""))
+                else:
+                    print(f"  ⚠️  Result {idx}: Missing title or URL (title={bool(paper_title)}, url={bool(paper_url)})")
 
             print(f"  ✓ Extracted {len(results)} valid results")
             return True, None, results
@@ -621,29 +726,30 @@ class SSRNScraper:
         if not results:
             return None, "No search results found", None, None
 
-        # Calculate combined similarity scores for each result
-        scored_results = []
-        for idx, (url, title, snippet) in enumerate(results[:max_results]):
-            similarity = self._calculate_combined_similarity(db_title, title)
-            scored_results.append((similarity, idx, title, url, snippet))
+        # Score all candidates in one batch; fuzzy/length components are kept for logging
+        candidates = results[:max_results]
+        scores = score_candidates(
+            db_title, [title for _, title, _ in candidates], self.length_similarity_weight
+        )
+        scored_results = [
+            (similarity, idx, title, url, snippet, fuzzy, word_ratio)
+            for idx, ((url, title, snippet), (similarity, fuzzy, word_ratio))
+            in enumerate(zip(candidates, scores))
+        ]
 
         # Sort by similarity (descending), with tie-breaker on index (ascending)
         scored_results.sort(key=lambda x: (-x[0], x[1]))
 
         # Log all matches
         print(f"  Results with combined similarity scores:")
-        for similarity, idx, title, url, _ in scored_results:
-            # Also show individual components for debugging
-            fuzzy = fuzz.partial_ratio(db_title.lower(), title.lower())
-            db_words = len(db_title.split())
+        db_words = len(db_title.split())
+        for similarity, idx, title, url, _, fuzzy, word_ratio in scored_results:
             result_words = len(title.split())
-            word_ratio = min(db_words, result_words) / max(db_words, result_words) if max(db_words, result_words) > 0 else 0
-
             print(f"    [{idx}] Score: {similarity:.1f} (fuzzy: {fuzzy}, length: {word_ratio:.2f}, words: {result_words}/{db_words})")
             print(f"        Title: {title[:80]}...")
 
         # Get best match
-        best_similarity, _, best_title, best_url, _ = scored_results[0]
+        best_similarity, _, best_title, best_url, _, _, _ = scored_results[0]
 
         # Check if match is good enough
         if best_similarity < self.similarity_threshold:
@@ -664,17 +770,17 @@ class SSRNScraper:
 
             self._human_pause(1.6, 0.5)
 
-            # Try multiple methods to extract abstract
-            abstract = self._extract_abstract_from_page()
+            # Capture the HTML content from the paper page; the abstract is
+            # server-rendered, so parse it locally instead of querying the DOM
+            # element by element over WebDriver
+            html_content = self.driver.page_source if self.driver else None
+            abstract = extract_abstract_from_html(html_content) if html_content else None
 
             if not abstract:
                 print(f"  ⚠️  Warning: Could not extract abstract, but page loaded")
             else:
                 print(f"  ✓ Extracted abstract ({len(abstract)} chars)")
 
-            # Capture the HTML content from the paper page
-            html_content = self.driver.page_source if self.driver else None
-
             return best_url, abstract, int(best_similarity), html_content
 
         except Exception as e:
@@ -683,121 +789,6 @@ class SSRNScraper:
             # Return URL anyway, even if abstract extraction failed, but no HTML
             return best_url, None, int(best_similarity), None
 
-    def _extract_abstract_from_page(self) -> Optional[str]:
-        """
-        Extract abstract from SSRN paper page using multiple strategies
-
-        Returns:
-            Abstract text or None if not found
-        """
-        strategies = [
-            # Strategy 1: div.abstract-text with paragraphs
-            lambda: self._extract_by_selector("div.abstract-text", include_header=False),
-            # Strategy 2: div.abstract-text direct text
-            lambda: self._extract_by_selector("div.abstract-text", direct_text=True),
-            # Strategy 3: Look for Abstract header then next paragraph
-            lambda: self._extract_after_header("Abstract"),
-            # Strategy 4: Any div containing "Abstract" header
-            lambda: self._extract_from_abstract_div(),
-        ]
-
-        for idx, strategy in enumerate(strategies, 1):
-            try:
-                abstract = strategy()
-                if abstract and len(abstract) > 50:  # Minimum reasonable abstract length
-                    return abstract
-            except Exception as e:
-                # Strategy failed, try next one
-                continue
-
-        return None
-
-    def _extract_by_selector(self, selector: str, include_header: bool = False, direct_text: bool = False) -> Optional[str]:
-        """
-        Extract abstract using CSS selector
-
-        Args:
-            selector: CSS selector for abstract container
-            include_header: Whether to include h3 header text
-            direct_text: Get direct text instead of paragraphs
-
-        Returns:
-            Abstract text or None
-        """
-        try:
-            drv = self._get_driver()
-            abstract_div = drv.find_element(By.CSS_SELECTOR, selector)
-
-            if direct_text:
-                # Get all text directly
-                return abstract_div.text.strip().replace('Abstract\n', '').strip()
-            else:
-                # Extract paragraphs
-                paragraphs = abstract_div.find_elements(By.TAG_NAME, "p")
-                if paragraphs:
-                    abstract = " ".join(p.text.strip() for p in paragraphs if p.text.strip())
-                    return abstract if abstract else None
-
-        except:
-            pass
-
-        return None
-
-    def _extract_after_header(self, header_text: str) -> Optional[str]:
-        """
-        Find Abstract header and extract following paragraphs
-
-        Args:
-            header_text: Header text to search for (e.g., "Abstract")
-
-        Returns:
-            Abstract text or None
-        """
-        try:
-            # Find all h3 elements
-            drv = self._get_driver()
-            headers = drv.find_elements(By.TAG_NAME, "h3")
-
-            for header in headers:
-                if header_text.lower() in header.text.lower():
-                    # Found the Abstract header, get parent and extract paragraphs
-                    parent = header.find_element(By.XPATH, "./..")
-                    paragraphs = parent.find_elements(By.TAG_NAME, "p")
-
-                    if paragraphs:
-                        abstract = " ".join(p.text.strip() for p in paragraphs if p.text.strip())
-                        return abstract if abstract else None
-        except:
-            pass
-
-        return None
-
-    def _extract_from_abstract_div(self) -> Optional[str]:
-        """
-        Find any div containing Abstract and extract text
-
-        Returns:
-            Abstract text or None
-        """
-        try:
-            # Find all divs
-            drv = self._get_driver()
-            divs = drv.find_elements(By.TAG_NAME, "div")
-
-            for div in divs:
-                # Check if this div contains "Abstract" header
-                class_attr = div.get_attribute("class") or ""
-                if "abstract" in class_attr.lower():
-                    text = div.text.strip()
-                    # Remove "Abstract" header if present
-                    text = text.replace('Abstract\n', '').replace('Abstract', '').strip()
-                    if len(text) > 50:
-                        return text
-        except:
-            pass
-
-        return None
-
     def _save_error_screenshot(self, title: str) -> Optional[str]:
         """
         Save screenshot when an error occurs
@@ -862,15 +853,7 @@ class SSRNScraper:
         Returns:
             Dictionary with scraping results
         """
-        result = {
-            'doi': doi,
-            'ssrn_url': None,
-            'abstract': None,
-            'html_file_path': None,
-            'match_score': None,
-            'error_message': None,
-            'success': False
-        }
+        result = self._new_result(doi)
 
         try:
             # Search SSRN and extract URLs from results page
@@ -918,17 +901,79 @@ class SSRNScraper:
             print(f"✗ {error_msg}")
             return result
 
-    def scrape_articles(self, articles_df, show_progress: bool = True) -> Dict:
+    @staticmethod
+    def _new_result(doi: str) -> Dict:
+        """Result of an article nothing was found for yet"""
+        return {
+            'doi': doi,
+            'ssrn_url': None,
+            'abstract': None,
+            'html_file_path': None,
+            'match_score': None,
+            'error_message': None,
+            'success': False
+        }
+
+    def _record_result(self, result: Dict, stats: Dict, pending_pages: List[Dict],
+                       pending_logs: List[Tuple[str, str, str, Optional[str]]]):
+        """Count a scrape result and queue its database rows"""
+        doi = result['doi']
+
+        # Queue for the database (HTML itself is not stored in DB, too large)
+        pending_pages.append(result)
+
+        # Log processing
+        if result['success']:
+            stats['success'] += 1
+            pending_logs.append((doi, 'scrape_ssrn', 'success', None))
+        elif result['match_score'] is not None and result['match_score'] < self.similarity_threshold:
+            stats['no_match'] += 1
+            pending_logs.append((doi, 'scrape_ssrn', 'no_match', result['error_message']))
+        else:
+            stats['failed'] += 1
+            pending_logs.append((doi, 'scrape_ssrn', 'failed', result['error_message']))
+
+    def _flush_results(self, pending_pages: List[Dict],
+                       pending_logs: List[Tuple[str, str, str, Optional[str]]]):
+        """Write queued page and log rows in one transaction, so neither lands without the other"""
+        with self.repo.transaction():
+            self.repo.bulk_insert_ssrn_pages(pending_pages)
+            self.repo.bulk_log_processing(pending_logs)
+        pending_pages.clear()
+        pending_logs.clear()
+
+    def _spawn_worker(self) -> 'SSRNScraper':
+        """Create a scraper with the same settings but its own browser session"""
+        return SSRNScraper(
+            self.repo,
+            crawl_delay=self.crawl_delay,
+            similarity_threshold=self.similarity_threshold,
+            length_similarity_weight=self.length_similarity_weight,
+            headless=self.headless,
+            html_storage_dir=self.html_storage_dir,
+            max_retries=self.max_retries,
+            backoff_factor=self.backoff_factor,
+        )
+
+    def scrape_articles(self, articles_df, show_progress: bool = True, workers: int = 1) -> Dict:
         """
         Scrape multiple articles from SSRN
 
         Args:
             articles_df: DataFrame with 'doi' and 'title' columns
             show_progress: Show progress bar
+            workers: Number of parallel browser sessions
 
         Returns:
             Dictionary with statistics
+
+        Raises:
+            RuntimeError: If every browser session failed with articles left
+                (results produced so far are still saved)
         """
+        if workers > 1 and len(articles_df) > 1:
+            return self._scrape_articles_parallel(articles_df, workers, show_progress)
+
         stats = {
             'total': len(articles_df),
             'success': 0,
@@ -936,17 +981,21 @@ class SSRNScraper:
             'no_match': 0
         }
 
+        # Scrape results are written in batches rather than one statement per article
+        pending_pages: List[Dict] = []
+        pending_logs: List[Tuple[str, str, str, Optional[str]]] = []
+
         # Setup webdriver
         self.setup_webdriver()
 
         try:
-            iterator = tqdm(articles_df.iterrows(), total=len(articles_df),
-                          desc="Scraping SSRN") if show_progress else articles_df.iterrows()
-
-            for idx, row in iterator:
-                doi = row['doi']
-                title = row['title']
+            # Plain column arrays avoid building a pandas Series per row
+            rows = enumerate(zip(articles_df['doi'].to_numpy(), articles_df['title'].to_numpy()))
+            iterator = tqdm(rows, total=len(articles_df),
+                          desc="Scraping SSRN") if show_progress else rows
 
+            for idx, (doi, title) in iterator:
+                started = time.monotonic()
                 if show_progress:
                     tqdm.write(f"\n{idx + 1}/{len(articles_df)}: {title[:60]}...")
                 else:
@@ -954,38 +1003,79 @@ class SSRNScraper:
 
                 # Scrape article
                 result = self.scrape_article(doi, title)
+                self._record_result(result, stats, pending_pages, pending_logs)
 
-                # Save to database
-                self.repo.insert_ssrn_page(
-                    doi=result['doi'],
-                    ssrn_url=result['ssrn_url'],
-                    html_content=None,  # Don't store HTML in DB (too large)
-                    html_file_path=result['html_file_path'],
-                    abstract=result['abstract'],
-                    match_score=result['match_score'],
-                    error_message=result['error_message']
-                )
-
-                # Log processing
-                if result['success']:
-                    stats['success'] += 1
-                    self.repo.log_processing(doi, 'scrape_ssrn', 'success')
-                elif result['match_score'] is not None and result['match_score'] < self.similarity_threshold:
-                    stats['no_match'] += 1
-                    self.repo.log_processing(doi, 'scrape_ssrn', 'no_match', result['error_message'])
-                else:
-                    stats['failed'] += 1
-                    self.repo.log_processing(doi, 'scrape_ssrn', 'failed', result['error_message'])
+                if len(pending_pages) >= self.WRITE_BATCH_SIZE:
+                    self._flush_results(pending_pages, pending_logs)
 
                 # Respect variable crawl delay (only between successful/normal operations)
                 if idx < len(articles_df) - 1:  # Don't delay after last item
-                    delay = self._get_next_delay()
-                    print(f"  ⏳ Next article in {delay:.1f}s...")
-                    time.sleep(delay)
+                    delay = self._remaining_delay(started)
+                    if delay > 0:
+                        print(f"  ⏳ Next article in {delay:.1f}s...")
+                        time.sleep(delay)
 
         finally:
-            # Clean up
-            if self.driver:
-                self.driver.quit()
+            try:
+                # Save whatever is still buffered, including on Ctrl-C or errors
+                self._flush_results(pending_pages, pending_logs)
+            finally:
+                # Clean up even if the final write failed
+                if self.driver:
+                    self.driver.quit()
+
+        return stats
+
+    def _scrape_articles_parallel(self, articles_df, workers: int, show_progress: bool) -> Dict:
+        """
+        Scrape with several browser sessions pulling from one shared work queue
+
+        Each worker thread drives its own Chrome instance and keeps its own
+        crawl delay. Only this (calling) thread touches the database, since
+        the DuckDB connection is not safe to share across threads.
+        """
+        stats = {
+            'total': len(articles_df),
+            'success': 0,
+            'failed': 0,
+            'no_match': 0
+        }
+        pending_pages: List[Dict] = []
+        pending_logs: List[Tuple[str, str, str, Optional[str]]] = []
+
+        def scrape(scraper: 'SSRNScraper', article: Tuple[str, str]):
+            started = time.monotonic()
+            result = scraper.scrape_article(*article)
+            return result, scraper._remaining_delay(started)
+
+        def quit_browser(scraper: 'SSRNScraper'):
+            if scraper.driver:
+                scraper.driver.quit()
+
+        def failed(article: Tuple[str, str], error: Exception) -> Dict:
+            result = self._new_result(article[0])
+            result['error_message'] = f"Unexpected error: {type(error).__name__}: {error}"
+            return result
+
+        def record(result: Dict):
+            self._record_result(result, stats, pending_pages, pending_logs)
+            if len(pending_pages) >= self.WRITE_BATCH_SIZE:
+                self._flush_results(pending_pages, pending_logs)
+
+        try:
+            run_browser_pool(
+                list(zip(articles_df['doi'].to_numpy(), articles_df['title'].to_numpy())),
+                workers,
+                spawn=lambda index: self._spawn_worker(),
+                process=scrape,
+                close=quit_browser,
+                failed=failed,
+                on_result=record,
+                desc="Scraping SSRN",
+                show_progress=show_progress,
+            )
+        finally:
+            # Keep whatever the workers produced, including on Ctrl-C or errors
+            self._flush_results(pending_pages, pending_logs)
 
         return stats
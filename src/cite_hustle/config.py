@@ -1,4 +1,5 @@
 """Configuration management for cite-hustle"""
+from functools import cached_property
 from pathlib import Path
 from pydantic_settings import BaseSettings
 
@@ -6,64 +7,65 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     """Application settings with sensible defaults"""
     
-    # Dropbox paths - consistent across machines
+    # Dropbox paths - consistent across machines. The derived directories are
+    # resolved (and created) once per process rather than on every access.
     dropbox_base: Path = Path.home() / "Dropbox" / "Github Data" / "cite-hustle"
     
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         """Main data directory"""
         return self.dropbox_base
     
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Cache directory for API responses"""
         path = self.dropbox_base / "cache"
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    @property
+    @cached_property
     def db_path(self) -> Path:
         """DuckDB database path"""
         path = self.dropbox_base / "DB"
         path.mkdir(parents=True, exist_ok=True)
         return path / "articles.duckdb"
     
-    @property
+    @cached_property
     def pdf_storage_dir(self) -> Path:
         """Directory for storing downloaded PDFs"""
         path = self.dropbox_base / "pdfs"
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    @property
+    @cached_property
     def html_storage_dir(self) -> Path:
         """Directory for storing SSRN HTML pages"""
         path = self.dropbox_base / "ssrn_html"
         path.mkdir(parents=True, exist_ok=True)
         return path
     
-    @property
+    @cached_property
     def metadata_dir(self) -> Path:
         """Directory for CSV metadata files"""
         path = self.dropbox_base / "metadata"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def wiki_dir(self) -> Path:
         """Research wiki root (process-paper compatible layout)"""
         path = self.dropbox_base / "wiki"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def quarantine_dir(self) -> Path:
         """Quarantine for PDFs that failed metadata verification"""
         path = self.dropbox_base / "pdfs" / "quarantine"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def reports_dir(self) -> Path:
         """Pipeline run reports (markdown, synced via Dropbox)"""
         path = self.dropbox_base / "reports"
@@ -1,15 +1,31 @@
 """DuckDB database models and schema management"""
+import atexit
 import time
+from typing import Dict, Optional
+
 import duckdb
 from pathlib import Path
 
 
+# Classifies an ssrn_pages.error_message into error_code, so retry tooling
+# filters on equality instead of substring-scanning every message
+SSRN_ERROR_CODE_SQL = """
+    CASE
+        WHEN {message} LIKE '%No search results%' THEN 'NO_RESULTS'
+        WHEN {message} LIKE '%Failed to search SSRN%' THEN 'SEARCH_FAILED'
+        WHEN {message} LIKE '%No match above threshold%' THEN 'LOW_MATCH'
+        WHEN {message} IS NOT NULL THEN 'OTHER'
+    END
+"""
+
+
 class DatabaseManager:
     """Centralized DuckDB connection and schema management"""
 
     def __init__(self, db_path: str | Path):
         self.db_path = str(db_path)
         self.conn = None
+        self.read_only = False
 
     def connect(self, read_only: bool = False, max_wait: int = 0):
         """Connect to DuckDB and load the full-text search extension.
@@ -30,6 +46,7 @@ class DatabaseManager:
         while True:
             try:
                 self.conn = duckdb.connect(self.db_path, read_only=read_only)
+                self.read_only = read_only
                 break
             except duckdb.Error as e:
                 if "lock" not in str(e).lower() or time.monotonic() >= deadline:
@@ -45,7 +62,44 @@ class DatabaseManager:
         self.conn.execute("INSTALL fts;")
         self.conn.execute("LOAD fts;")
 
+        # Writers may run against a database created by an older release;
+        # read-only connections cannot alter it and must cope with the old schema
+        if not read_only:
+            self._upgrade_schema()
+
         return self.conn
+
+    def has_column(self, table: str, column: str) -> bool:
+        """Whether a main-schema table has the given column"""
+        return self.conn.execute(
+            """
+            SELECT COUNT(*) FROM duckdb_columns()
+            WHERE schema_name = 'main' AND table_name = ? AND column_name = ?
+        """,
+            [table, column],
+        ).fetchone()[0] > 0
+
+    def _upgrade_schema(self):
+        """Add columns introduced after a table was first created
+
+        Cheap when there is nothing to do: a catalog lookup per column, so it
+        runs on every read-write connection rather than only on `init`.
+        """
+        tables = {
+            name
+            for (name,) in self.conn.execute(
+                "SELECT table_name FROM duckdb_tables() WHERE schema_name = 'main'"
+            ).fetchall()
+        }
+
+        # ssrn_pages.error_code: add it and classify the existing messages
+        if "ssrn_pages" in tables and not self.has_column("ssrn_pages", "error_code"):
+            self.conn.execute("ALTER TABLE ssrn_pages ADD COLUMN error_code VARCHAR")
+            self.conn.execute(f"""
+                UPDATE ssrn_pages
+                SET error_code = {SSRN_ERROR_CODE_SQL.format(message="error_message")}
+                WHERE error_message IS NOT NULL
+            """)
     
     def initialize_schema(self):
         """Create tables with proper schema"""
@@ -91,9 +145,13 @@ class DatabaseManager:
                 match_score INTEGER,
                 scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 error_message VARCHAR,
+                error_code VARCHAR,
                 FOREIGN KEY (doi) REFERENCES articles(doi)
             );
         """)
+
+        # Tables created by an older schema: add the newer columns
+        self._upgrade_schema()
         
         # Create sequence for processing_log (must come before table creation)
         self.conn.execute("""
@@ -189,7 +247,12 @@ class DatabaseManager:
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_articles_year ON articles(year);",
             "CREATE INDEX IF NOT EXISTS idx_articles_journal ON articles(journal_issn);",
-            "CREATE INDEX IF NOT EXISTS idx_ssrn_downloaded ON ssrn_pages(pdf_downloaded);",
+            # ssrn_pages.doi is already covered by its PRIMARY KEY index. A
+            # boolean index only adds maintenance to every upsert, because
+            # DuckDB rewrites updates of indexed columns as delete + insert.
+            "DROP INDEX IF EXISTS idx_ssrn_downloaded;",
+            # Likewise no index on ssrn_pages.error_code: it has four values,
+            # which an ART index cannot narrow beyond the columnar scan.
             "CREATE INDEX IF NOT EXISTS idx_processing_log_doi ON processing_log(doi);",
             "CREATE INDEX IF NOT EXISTS idx_pdf_files_verify ON pdf_files(verify_status);",
             "CREATE INDEX IF NOT EXISTS idx_wiki_pages_status ON wiki_pages(status);",
@@ -201,35 +264,104 @@ class DatabaseManager:
             except Exception as e:
                 print(f"Index creation note: {e}")
     
-    def create_fts_indexes(self):
-        """Create full-text search indexes using DuckDB FTS extension"""
+    def create_fts_indexes(self, titles: bool = True, abstracts: bool = True):
+        """Create full-text search indexes using DuckDB FTS extension
+
+        Each index is a full rebuild of its table, so callers that only changed
+        titles or only abstracts can skip the other one. The rebuild runs in
+        one transaction: on failure the previous indexes stay in place.
+        """
         try:
-            # Full-text search on titles
-            self.conn.execute("""
-                PRAGMA create_fts_index(
-                    'articles', 
-                    'doi', 
-                    'title', 
-                    overwrite=1
-                );
-            """)
-            print("✓ Full-text search index created for article titles")
-            
-            # Full-text search on abstracts
-            self.conn.execute("""
-                PRAGMA create_fts_index(
-                    'ssrn_pages', 
-                    'doi', 
-                    'abstract',
-                    overwrite=1
-                );
-            """)
-            print("✓ Full-text search index created for abstracts")
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                if titles:
+                    # Full-text search on titles
+                    self.conn.execute("""
+                        PRAGMA create_fts_index(
+                            'articles', 
+                            'doi', 
+                            'title', 
+                            overwrite=1
+                        );
+                    """)
+
+                if abstracts:
+                    # Full-text search on abstracts
+                    self.conn.execute("""
+                        PRAGMA create_fts_index(
+                            'ssrn_pages', 
+                            'doi', 
+                            'abstract',
+                            overwrite=1
+                        );
+                    """)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+            # Fold the freshly written index tables into the database file now
+            # instead of leaving them in the WAL for the next open to replay
+            self.conn.execute("CHECKPOINT")
+
+            if titles:
+                print("✓ Full-text search index created for article titles")
+            if abstracts:
+                print("✓ Full-text search index created for abstracts")
         except Exception as e:
             print(f"⚠️  FTS index creation error: {e}")
             print("   Search will still work but may be slower")
-    
+
+    def get_fts_index_sizes(self) -> Dict[str, int]:
+        """Document counts of the FTS indexes, keyed by indexed table
+
+        Read from the catalog's estimated_size, so checking a fresh index
+        never scans its docs table.
+        """
+        rows = self.conn.execute("""
+            SELECT schema_name, estimated_size
+            FROM duckdb_tables()
+            WHERE schema_name LIKE 'fts_main_%' AND table_name = 'docs'
+        """).fetchall()
+        return {schema.removeprefix("fts_main_"): size for schema, size in rows}
+
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
+            self.conn = None
+
+
+_shared_db: Optional[DatabaseManager] = None
+
+
+def get_db(db_path: str | Path, read_only: bool = False, max_wait: int = 0) -> DatabaseManager:
+    """Return the process-wide DatabaseManager for db_path, connecting on first use.
+
+    Later calls in the same process (chained or repeated CLI invocations)
+    reuse the open connection and its loaded FTS extension. A read-write
+    connection also serves read-only callers; a read-only one is reopened
+    read-write when a writer asks for it.
+    """
+    global _shared_db
+    db = _shared_db
+    if (
+        db is not None
+        and db.conn is not None
+        and db.db_path == str(db_path)
+        and (read_only or not db.read_only)
+    ):
+        return db
+
+    if db is not None:
+        db.close()
+    db = DatabaseManager(db_path)
+    db.connect(read_only=read_only, max_wait=max_wait)
+    _shared_db = db
+    return db
+
+
+@atexit.register
+def _close_shared_db():
+    if _shared_db is not None:
+        _shared_db.close()
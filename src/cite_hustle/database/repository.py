@@ -1,10 +1,12 @@
 """Data access layer for articles and SSRN data"""
 
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
+import duckdb
 import pandas as pd
 
-from cite_hustle.database.models import DatabaseManager
+from cite_hustle.database.models import SSRN_ERROR_CODE_SQL, DatabaseManager
 from cite_hustle.paths import to_portable
 
 
@@ -15,6 +17,17 @@ class ArticleRepository:
         self.db = db_manager
         self.conn = db_manager.conn
 
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one commit; rolled back if the block raises"""
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
     # Articles
     def insert_article(
         self,
@@ -44,7 +57,9 @@ class ArticleRepository:
         if not articles:
             return
 
-        df = pd.DataFrame(articles)
+        # A DOI can show up under two publication years (online vs. print date), and
+        # ON CONFLICT cannot update the same row twice in one statement
+        df = pd.DataFrame(articles).drop_duplicates(subset="doi", keep="last")
         # Specify columns explicitly to avoid timestamp column issues
         self.conn.execute("""
             INSERT INTO articles (doi, title, authors, year, journal_issn, journal_name, publisher)
@@ -84,10 +99,14 @@ class ArticleRepository:
     ):
         """Insert or update SSRN page data"""
         self.conn.execute(
-            """
+            f"""
             INSERT INTO ssrn_pages
-            (doi, ssrn_url, html_content, html_file_path, abstract, match_score, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (doi, ssrn_url, html_content, html_file_path, abstract, match_score, error_message,
+             error_code)
+            SELECT *, {SSRN_ERROR_CODE_SQL.format(message="error_message")}
+            FROM (VALUES (?, ?, ?, ?, ?, ?, CAST(? AS VARCHAR)))
+                AS v(doi, ssrn_url, html_content, html_file_path, abstract, match_score,
+                     error_message)
             ON CONFLICT (doi) DO UPDATE SET
                 ssrn_url = EXCLUDED.ssrn_url,
                 html_content = EXCLUDED.html_content,
@@ -95,11 +114,48 @@ class ArticleRepository:
                 abstract = EXCLUDED.abstract,
                 match_score = EXCLUDED.match_score,
                 error_message = EXCLUDED.error_message,
+                error_code = EXCLUDED.error_code,
                 scraped_at = now()
         """,
             [doi, ssrn_url, html_content, html_file_path, abstract, match_score, error_message],
         )
 
+    def bulk_insert_ssrn_pages(self, pages: List[Dict]):
+        """Insert or update many SSRN page rows (same semantics as insert_ssrn_page)"""
+        if not pages:
+            return
+
+        df = pd.DataFrame(
+            pages,
+            columns=["doi", "ssrn_url", "html_file_path", "abstract", "match_score", "error_message"],
+        ).drop_duplicates(subset="doi", keep="last")
+        # Cast explicitly: a batch where a column is all None has no inferable type
+        error_message = "CAST(error_message AS VARCHAR)"
+        self.conn.execute(f"""
+            INSERT INTO ssrn_pages
+            (doi, ssrn_url, html_content, html_file_path, abstract, match_score, error_message,
+             error_code)
+            SELECT
+                doi,
+                CAST(ssrn_url AS VARCHAR),
+                NULL,
+                CAST(html_file_path AS VARCHAR),
+                CAST(abstract AS VARCHAR),
+                CAST(match_score AS INTEGER),
+                {error_message},
+                {SSRN_ERROR_CODE_SQL.format(message=error_message)}
+            FROM df
+            ON CONFLICT (doi) DO UPDATE SET
+                ssrn_url = EXCLUDED.ssrn_url,
+                html_content = EXCLUDED.html_content,
+                html_file_path = EXCLUDED.html_file_path,
+                abstract = EXCLUDED.abstract,
+                match_score = EXCLUDED.match_score,
+                error_message = EXCLUDED.error_message,
+                error_code = EXCLUDED.error_code,
+                scraped_at = now()
+        """)
+
     def get_articles_missing_abstract(
         self,
         limit: Optional[int] = None,
@@ -163,6 +219,19 @@ class ArticleRepository:
             [doi, abstract],
         )
 
+    def bulk_update_abstracts(self, updates: List[Tuple[str, str]]):
+        """Overwrite ssrn_pages.abstract for many (doi, abstract) pairs in one statement"""
+        if not updates:
+            return
+
+        df = pd.DataFrame(updates, columns=["doi", "abstract"])
+        self.conn.execute("""
+            UPDATE ssrn_pages
+            SET abstract = u.abstract
+            FROM df AS u
+            WHERE ssrn_pages.doi = u.doi
+        """)
+
     def update_pdf_info(
         self, doi: str, pdf_url: str, pdf_file_path: Optional[str] = None, downloaded: bool = False
     ):
@@ -180,6 +249,22 @@ class ArticleRepository:
             [pdf_url, pdf_file_path, downloaded, doi],
         )
 
+    def bulk_update_pdf_info(self, updates: List[Tuple[str, Optional[str], str, bool]]):
+        """Apply update_pdf_info to many (doi, pdf_url, pdf_file_path, downloaded) rows at once"""
+        if not updates:
+            return
+
+        df = pd.DataFrame(updates, columns=["doi", "pdf_url", "pdf_file_path", "downloaded"])
+        df["pdf_file_path"] = df["pdf_file_path"].map(to_portable)
+        self.conn.execute("""
+            UPDATE ssrn_pages
+            SET pdf_url = CAST(u.pdf_url AS VARCHAR),
+                pdf_file_path = u.pdf_file_path,
+                pdf_downloaded = u.downloaded
+            FROM df AS u
+            WHERE ssrn_pages.doi = u.doi
+        """)
+
     def reset_ssrn_download(self, doi: str):
         """Clear the SSRN download flags so a paper becomes pending again."""
         self.conn.execute(
@@ -206,7 +291,8 @@ class ArticleRepository:
         limit: Optional[int] = None,
         downloaded: Optional[bool] = None,
         include_unavailable: bool = True,
-    ) -> pd.DataFrame:
+        as_df: bool = True,
+    ) -> pd.DataFrame | List[Tuple]:
         """Get articles that have SSRN URLs.
 
         Args:
@@ -216,6 +302,8 @@ class ArticleRepository:
             include_unavailable: If False, skip papers previously marked as
                 "not available for download" (see mark_pdf_unavailable), so
                 repeat runs don't keep retrying them.
+            as_df: If False, return plain (doi, title, ssrn_url, pdf_downloaded,
+                pdf_file_path) tuples for callers that just iterate once.
         """
         query = """
             SELECT s.doi, a.title, s.ssrn_url, s.pdf_downloaded, s.pdf_file_path
@@ -245,7 +333,8 @@ class ArticleRepository:
         if limit:
             query += f" LIMIT {int(limit)}"
 
-        return self.conn.execute(query).fetchdf()
+        result = self.conn.execute(query)
+        return result.fetchdf() if as_df else result.fetchall()
 
     def mark_pdf_unavailable(self, doi: str):
         """Record that a paper has no downloadable PDF on SSRN.
@@ -318,6 +407,42 @@ class ArticleRepository:
             [doi, source, source_url, pdf_url, pdf_file_path, match_score],
         )
 
+    def bulk_upsert_pdf_files(self, files: List[Dict]):
+        """Record many PDFs on disk in one statement (same semantics as upsert_pdf_file)"""
+        if not files:
+            return
+
+        df = pd.DataFrame(
+            files,
+            columns=["doi", "source", "source_url", "pdf_url", "pdf_file_path", "match_score"],
+        ).drop_duplicates(subset="doi", keep="last")
+        df["pdf_file_path"] = df["pdf_file_path"].map(to_portable)
+        # Cast explicitly: a batch where a column is all None has no inferable type
+        self.conn.execute("""
+            INSERT INTO pdf_files (doi, source, source_url, pdf_url, pdf_file_path, match_score)
+            SELECT
+                doi,
+                source,
+                CAST(source_url AS VARCHAR),
+                CAST(pdf_url AS VARCHAR),
+                pdf_file_path,
+                CAST(match_score AS DOUBLE)
+            FROM df
+            ON CONFLICT (doi) DO UPDATE SET
+                source = EXCLUDED.source,
+                source_url = EXCLUDED.source_url,
+                pdf_url = EXCLUDED.pdf_url,
+                pdf_file_path = EXCLUDED.pdf_file_path,
+                match_score = EXCLUDED.match_score,
+                downloaded_at = now(),
+                verify_status = 'pending',
+                verify_method = NULL,
+                verify_score = NULL,
+                verify_model = NULL,
+                verify_reason = NULL,
+                verified_at = NULL
+        """)
+
     def delete_pdf_file(self, doi: str):
         """Remove the pdf_files row (e.g. after quarantining a mismatched PDF)."""
         self.conn.execute("DELETE FROM pdf_files WHERE doi = ?", [doi])
@@ -363,19 +488,44 @@ class ArticleRepository:
             [status, method, score, model, reason, doi],
         )
 
-    def get_articles_without_pdf(self, limit: Optional[int] = None) -> pd.DataFrame:
+    def get_articles_without_pdf(
+        self,
+        limit: Optional[int] = None,
+        sources: Optional[List[str]] = None,
+        recheck_cutoff=None,
+    ) -> pd.DataFrame:
         """Get articles with no PDF on disk where the SSRN path has failed.
 
         Eligible for fallback resolution: no pdf_files row, and either SSRN
         never matched the paper (no ssrn_url) or the SSRN download was marked
         unavailable. Articles still pending a first SSRN download attempt are
         left to the SSRN downloader.
+
+        When sources and recheck_cutoff (datetime) are given, articles whose
+        every source was already checked since the cutoff are excluded, and
+        a checked_sources column lists the sources to skip for the rest.
         """
-        query = """
-            SELECT a.doi, a.title, a.authors, a.year, a.journal_name
+        params: list = []
+        recent_join = ""
+        recent_filter = ""
+        checked_column = ""
+        if sources and recheck_cutoff is not None:
+            recent_join = """
+            LEFT JOIN (
+                SELECT doi, list(source) AS checked_sources
+                FROM pdf_candidates
+                WHERE checked_at >= ? AND list_contains(?, source)
+                GROUP BY doi
+            ) c ON a.doi = c.doi"""
+            recent_filter = "AND COALESCE(len(c.checked_sources), 0) < ?"
+            checked_column = ", COALESCE(c.checked_sources, []) AS checked_sources"
+            params = [recheck_cutoff, list(sources), len(set(sources))]
+
+        query = f"""
+            SELECT a.doi, a.title, a.authors, a.year, a.journal_name{checked_column}
             FROM articles a
             LEFT JOIN pdf_files p ON a.doi = p.doi
-            LEFT JOIN ssrn_pages s ON a.doi = s.doi
+            LEFT JOIN ssrn_pages s ON a.doi = s.doi{recent_join}
             WHERE p.doi IS NULL
               AND (
                   s.ssrn_url IS NULL
@@ -386,18 +536,12 @@ class ArticleRepository:
                         AND pl.status = 'unavailable'
                   )
               )
+              {recent_filter}
             ORDER BY a.year DESC
         """
         if limit:
             query += f" LIMIT {int(limit)}"
-        return self.conn.execute(query).fetchdf()
-
-    def get_recent_candidate_checks(self, cutoff) -> set:
-        """Get (doi, source) pairs already checked since cutoff (datetime)."""
-        rows = self.conn.execute(
-            "SELECT doi, source FROM pdf_candidates WHERE checked_at >= ?", [cutoff]
-        ).fetchall()
-        return set(rows)
+        return self.conn.execute(query, params).fetchdf()
 
     def record_pdf_candidate(
         self,
@@ -582,6 +726,17 @@ class ArticleRepository:
             [doi, stage, status, error_message],
         )
 
+    def bulk_log_processing(self, entries: List[Tuple[str, str, str, Optional[str]]]):
+        """Log many (doi, stage, status, error_message) entries in one statement"""
+        if not entries:
+            return
+
+        df = pd.DataFrame(entries, columns=["doi", "stage", "status", "error_message"])
+        self.conn.execute("""
+            INSERT INTO processing_log (doi, stage, status, error_message)
+            SELECT doi, stage, status, CAST(error_message AS VARCHAR) FROM df
+        """)
+
     def get_missing_abstract_count(self) -> int:
         """Count articles missing abstracts (null or empty)."""
         result = self.conn.execute(
@@ -697,55 +852,51 @@ class ArticleRepository:
         """Get database statistics"""
         stats = {}
 
-        # Total articles
-        stats["total_articles"] = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
-
-        # Articles by year
-        stats["by_year"] = (
-            self.conn.execute("""
-            SELECT year, COUNT(*) as count
+        # Total and per-year article counts in one scan: the empty grouping
+        # set produces the grand-total row (year and grouping flag both set)
+        year_rows = self.conn.execute("""
+            SELECT year, GROUPING(year) AS is_total, COUNT(*) AS count
             FROM articles
-            GROUP BY year
-            ORDER BY year DESC
-        """)
-            .fetchdf()
-            .to_dict("records")
-        )
-
-        # SSRN pages scraped
-        stats["ssrn_scraped"] = self.conn.execute(
-            "SELECT COUNT(*) FROM ssrn_pages WHERE abstract IS NOT NULL"
-        ).fetchone()[0]
-
-        # PDFs downloaded
-        stats["pdfs_downloaded"] = self.conn.execute(
-            "SELECT COUNT(*) FROM ssrn_pages WHERE pdf_downloaded = TRUE"
-        ).fetchone()[0]
+            GROUP BY GROUPING SETS ((year), ())
+            ORDER BY is_total DESC, year DESC
+        """).fetchall()
+        stats["total_articles"] = year_rows[0][2]
+        stats["by_year"] = [{"year": year, "count": count} for year, _, count in year_rows[1:]]
+
+        # SSRN scrape/download progress in a single scan of ssrn_pages
+        ssrn_total, ssrn_scraped, pdfs_downloaded, pending_downloads = self.conn.execute("""
+            SELECT
+                COUNT(*),
+                COUNT(*) FILTER (WHERE abstract IS NOT NULL),
+                COUNT(*) FILTER (WHERE pdf_downloaded = TRUE),
+                COUNT(*) FILTER (
+                    WHERE pdf_url IS NOT NULL
+                    AND (pdf_downloaded = FALSE OR pdf_downloaded IS NULL)
+                )
+            FROM ssrn_pages
+        """).fetchone()
+
+        stats["ssrn_scraped"] = ssrn_scraped
+        stats["pdfs_downloaded"] = pdfs_downloaded
 
         # Pending tasks
-        stats["pending_ssrn_scrapes"] = (
-            stats["total_articles"]
-            - self.conn.execute("SELECT COUNT(*) FROM ssrn_pages").fetchone()[0]
-        )
-
-        stats["pending_pdf_downloads"] = self.conn.execute("""
-            SELECT COUNT(*) FROM ssrn_pages
-            WHERE pdf_url IS NOT NULL AND (pdf_downloaded = FALSE OR pdf_downloaded IS NULL)
-        """).fetchone()[0]
-
-        # PDFs on disk by source (any-source pipeline)
-        stats["pdfs_by_source"] = dict(
-            self.conn.execute(
-                "SELECT source, COUNT(*) FROM pdf_files GROUP BY source ORDER BY source"
-            ).fetchall()
-        )
-
-        # Verification breakdown
-        stats["pdfs_by_verify_status"] = dict(
-            self.conn.execute(
-                "SELECT verify_status, COUNT(*) FROM pdf_files GROUP BY verify_status"
-            ).fetchall()
-        )
+        stats["pending_ssrn_scrapes"] = stats["total_articles"] - ssrn_total
+        stats["pending_pdf_downloads"] = pending_downloads
+
+        # PDFs on disk by source (any-source pipeline) and by verification
+        # status, both from a single scan of pdf_files
+        stats["pdfs_by_source"] = {}
+        stats["pdfs_by_verify_status"] = {}
+        for source, verify_status, by_source, count in self.conn.execute("""
+            SELECT source, verify_status, GROUPING(verify_status) = 1, COUNT(*)
+            FROM pdf_files
+            GROUP BY GROUPING SETS ((source), (verify_status))
+            ORDER BY source
+        """).fetchall():
+            if by_source:
+                stats["pdfs_by_source"][source] = count
+            else:
+                stats["pdfs_by_verify_status"][verify_status] = count
 
         # Quarantined PDFs (mismatches recorded in processing_log; row removed from pdf_files)
         stats["pdfs_quarantined"] = self.conn.execute("""
@@ -765,19 +916,27 @@ class ArticleRepository:
         """
         Full-text search on article titles using DuckDB FTS extension
 
-        Uses BM25 ranking for relevance scoring.
+        Uses BM25 ranking for relevance scoring. The score is computed once
+        per row in a subquery and filtered on, rather than evaluated again in
+        the WHERE clause.
         """
-        result = self.conn.execute(
-            """
-            SELECT a.doi, a.title, a.authors, a.year, a.journal_name,
-                   fts_main_articles.match_bm25(a.doi, ?) AS score
-            FROM articles a
-            WHERE fts_main_articles.match_bm25(a.doi, ?) IS NOT NULL
-            ORDER BY score DESC
-            LIMIT ?
-        """,
-            [query, query, limit],
-        ).fetchall()
+        try:
+            result = self.conn.execute(
+                """
+                SELECT * FROM (
+                    SELECT a.doi, a.title, a.authors, a.year, a.journal_name,
+                           fts_main_articles.match_bm25(a.doi, ?) AS score
+                    FROM articles a
+                )
+                WHERE score IS NOT NULL
+                ORDER BY score DESC
+                LIMIT ?
+            """,
+                [query, limit],
+            ).fetchall()
+        except duckdb.CatalogException:
+            # Index not built yet: a fresh database before its first collect
+            return []
 
         return [
             dict(zip(["doi", "title", "authors", "year", "journal", "score"], row))
@@ -788,20 +947,27 @@ class ArticleRepository:
         """
         Full-text search on abstracts using DuckDB FTS extension
 
-        Uses BM25 ranking for relevance scoring.
+        Uses BM25 ranking for relevance scoring, computed once per row as in
+        search_by_title.
         """
-        result = self.conn.execute(
-            """
-            SELECT s.doi, a.title, s.abstract, a.year, a.journal_name,
-                   fts_main_ssrn_pages.match_bm25(s.doi, ?) AS score
-            FROM ssrn_pages s
-            JOIN articles a ON s.doi = a.doi
-            WHERE fts_main_ssrn_pages.match_bm25(s.doi, ?) IS NOT NULL
-            ORDER BY score DESC
-            LIMIT ?
-        """,
-            [query, query, limit],
-        ).fetchall()
+        try:
+            result = self.conn.execute(
+                """
+                SELECT * FROM (
+                    SELECT s.doi, a.title, s.abstract, a.year, a.journal_name,
+                           fts_main_ssrn_pages.match_bm25(s.doi, ?) AS score
+                    FROM ssrn_pages s
+                    JOIN articles a ON s.doi = a.doi
+                )
+                WHERE score IS NOT NULL
+                ORDER BY score DESC
+                LIMIT ?
+            """,
+                [query, limit],
+            ).fetchall()
+        except duckdb.CatalogException:
+            # Index not built yet: a fresh database before its first collect
+            return []
 
         return [
             dict(zip(["doi", "title", "abstract", "year", "journal", "score"], row))
@@ -223,8 +223,8 @@ class PDFVerifier:
     def verify_batch(self, rows) -> dict:
         """Verify a DataFrame of pending PDFs; returns counts by outcome."""
         counts = {"match": 0, "mismatch": 0, "uncertain": 0, "unreadable": 0}
-        for _, row in rows.iterrows():
-            status = self.verify_one(row.to_dict())
+        for row in rows.to_dict("records"):
+            status = self.verify_one(row)
             counts[status] += 1
             symbol = {"match": "✓", "mismatch": "✗", "uncertain": "?", "unreadable": "!"}[status]
             print(f"  {symbol} {row['doi']}: {status}")
@@ -122,7 +122,7 @@ class WikiBridge:
         taken |= {p.stem for p in self.sources_dir.glob("*.md")}
 
         keys: dict[str, str] = {}
-        for _, row in batch.iterrows():
+        for row in batch.to_dict("records"):
             doi = row["doi"]
             existing = self.repo.get_wiki_page_by_doi(doi)
             if existing:
@@ -137,7 +137,7 @@ class WikiBridge:
     def write_manifest(self, batch, keys: dict[str, str]) -> Path:
         """Write the process-paper manifest for the batch (rewritten each run)."""
         rows = []
-        for _, row in batch.iterrows():
+        for row in batch.to_dict("records"):
             doi = row["doi"]
             rows.append(
                 {
@@ -40,8 +40,8 @@ def _write_by_journal(pages, index_dir: Path) -> Path:
         lines.append("_No papers ingested yet._\n")
     for journal, group in pages.groupby("journal_name", sort=True):
         lines.append(f"## {journal}\n\n")
-        for _, row in group.sort_values(["year", "title"], ascending=[False, True]).iterrows():
-            lines.append(_entry_line(row))
+        ordered = group.sort_values(["year", "title"], ascending=[False, True])
+        lines.extend(_entry_line(row) for row in ordered.to_dict("records"))
         lines.append("\n")
     path = index_dir / "by-journal.md"
     path.write_text("".join(lines), encoding="utf-8")
@@ -54,8 +54,8 @@ def _write_by_year(pages, index_dir: Path) -> Path:
         lines.append("_No papers ingested yet._\n")
     for year, group in sorted(pages.groupby("year"), key=lambda kv: kv[0], reverse=True):
         lines.append(f"## {year}\n\n")
-        for _, row in group.sort_values(["journal_name", "title"]).iterrows():
-            lines.append(_entry_line(row))
+        ordered = group.sort_values(["journal_name", "title"])
+        lines.extend(_entry_line(row) for row in ordered.to_dict("records"))
         lines.append("\n")
     path = index_dir / "by-year.md"
     path.write_text("".join(lines), encoding="utf-8")
@@ -65,7 +65,8 @@ def _write_by_year(pages, index_dir: Path) -> Path:
 def _write_topics(pages, wiki_dir: Path, index_dir: Path) -> Path:
     """Topics index: every concept page plus the source pages it references."""
     concepts_dir = wiki_dir / "concepts"
-    all_keys = set(pages["bib_key"]) if not pages.empty else set()
+    # One dict per page, keyed for the per-concept lookups below
+    by_key = {row["bib_key"]: row for row in pages.to_dict("records")}
     referenced: set[str] = set()
 
     lines = [HEADER, "# Papers by topic\n\n"]
@@ -82,12 +83,11 @@ def _write_topics(pages, wiki_dir: Path, index_dir: Path) -> Path:
         title = title_match.group(1).strip() if title_match else concept_path.stem
         lines.append(f"## [{title}](../concepts/{concept_path.name})\n\n")
 
-        linked = sorted(set(re.findall(r"sources/([a-z0-9]+)\.md", content)) & all_keys)
+        linked = sorted(set(re.findall(r"sources/([a-z0-9]+)\.md", content)) & by_key.keys())
         referenced.update(linked)
         if linked:
-            keyed = pages.set_index("bib_key")
             for key in linked:
-                row = keyed.loc[key]
+                row = by_key[key]
                 lines.append(
                     f"- [{row['title']}](../sources/{key}.md) ({row['authors']}, {row['year']})\n"
                 )
@@ -99,10 +99,8 @@ def _write_topics(pages, wiki_dir: Path, index_dir: Path) -> Path:
     if not unclassified.empty:
         lines.append("## Unclassified\n\n")
         lines.append("_Ingested but not yet linked from any concept page._\n\n")
-        for _, row in unclassified.sort_values(
-            ["year", "title"], ascending=[False, True]
-        ).iterrows():
-            lines.append(_entry_line(row))
+        ordered = unclassified.sort_values(["year", "title"], ascending=[False, True])
+        lines.extend(_entry_line(row) for row in ordered.to_dict("records"))
 
     path = index_dir / "topics.md"
     path.write_text("".join(lines), encoding="utf-8")
@@ -0,0 +1,118 @@
+"""Tests for schema upgrades of existing databases."""
+
+import duckdb
+import pytest
+
+from cite_hustle.database.models import DatabaseManager
+from cite_hustle.database.repository import ArticleRepository
+
+
+# ssrn_pages as created before error_code existed
+BASELINE_SCHEMA = """
+    CREATE TABLE articles (
+        doi VARCHAR PRIMARY KEY,
+        title VARCHAR NOT NULL,
+        authors VARCHAR,
+        year INTEGER NOT NULL,
+        journal_issn VARCHAR,
+        journal_name VARCHAR,
+        publisher VARCHAR,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE ssrn_pages (
+        doi VARCHAR PRIMARY KEY,
+        ssrn_url VARCHAR,
+        ssrn_id VARCHAR,
+        html_content VARCHAR,
+        html_file_path VARCHAR,
+        abstract TEXT,
+        pdf_url VARCHAR,
+        pdf_downloaded BOOLEAN DEFAULT FALSE,
+        pdf_file_path VARCHAR,
+        match_score INTEGER,
+        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        error_message VARCHAR,
+        FOREIGN KEY (doi) REFERENCES articles(doi)
+    );
+"""
+
+MESSAGES = {
+    "10.1/none": ("No search results found on SSRN", "NO_RESULTS"),
+    "10.1/failed": ("Failed to search SSRN: timeout", "SEARCH_FAILED"),
+    "10.1/low": ("No match above threshold 85. Best: 61.0", "LOW_MATCH"),
+    "10.1/other": ("Browser crashed", "OTHER"),
+    "10.1/ok": (None, None),
+}
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    """A database file with the pre-error_code schema and one row per error kind"""
+    path = tmp_path / "articles.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute(BASELINE_SCHEMA)
+    for doi, (message, _) in MESSAGES.items():
+        conn.execute(
+            "INSERT INTO articles (doi, title, year) VALUES (?, 'T', 2020)", [doi]
+        )
+        conn.execute(
+            "INSERT INTO ssrn_pages (doi, error_message) VALUES (?, ?)", [doi, message]
+        )
+    conn.execute("INSERT INTO articles (doi, title, year) VALUES ('10.1/new', 'T', 2020)")
+    conn.close()
+    return path
+
+
+def test_read_write_connect_adds_and_backfills_error_code(baseline_db):
+    db = DatabaseManager(baseline_db)
+    db.connect()
+
+    assert db.has_column("ssrn_pages", "error_code")
+    codes = dict(db.conn.execute("SELECT doi, error_code FROM ssrn_pages").fetchall())
+    assert codes == {doi: code for doi, (_, code) in MESSAGES.items()}
+    db.close()
+
+
+def test_read_only_connect_leaves_old_schema(baseline_db):
+    db = DatabaseManager(baseline_db)
+    db.connect(read_only=True)
+
+    assert not db.has_column("ssrn_pages", "error_code")
+    db.close()
+
+
+def test_inserts_work_after_upgrade(baseline_db):
+    db = DatabaseManager(baseline_db)
+    db.connect()
+    repo = ArticleRepository(db)
+
+    repo.insert_ssrn_page(
+        "10.1/new", None, None, None, None, None, error_message="No search results found"
+    )
+    repo.bulk_insert_ssrn_pages(
+        [
+            {
+                "doi": "10.1/other",
+                "ssrn_url": "https://ssrn.com/abstract=1",
+                "html_file_path": None,
+                "abstract": "A",
+                "match_score": 95,
+                "error_message": None,
+            },
+            {
+                "doi": "10.1/ok",
+                "ssrn_url": None,
+                "html_file_path": None,
+                "abstract": None,
+                "match_score": 70,
+                "error_message": "No match above threshold 85. Best: 70.0",
+            },
+        ]
+    )
+
+    codes = dict(db.conn.execute("SELECT doi, error_code FROM ssrn_pages").fetchall())
+    assert codes["10.1/new"] == "NO_RESULTS"
+    assert codes["10.1/other"] is None
+    assert codes["10.1/ok"] == "LOW_MATCH"
+    db.close()
@@ -23,3 +23,16 @@ def test_journal_dict_keeps_every_journal():
     """get_journal_dict() must not drop entries (it would on an ISSN collision)."""
     all_journals = JournalRegistry.get_all_journals()
     assert len(JournalRegistry.get_journal_dict()) == len(all_journals)
+
+
+def test_cached_collections_cannot_be_mutated_by_callers():
+    """The derived collections are memoized; a caller's edits must not leak into the registry."""
+    count = len(JournalRegistry.get_all_journals())
+
+    JournalRegistry.get_all_journals().clear()
+    JournalRegistry.get_journal_dict().clear()
+    JournalRegistry.get_issn_list("all").clear()
+
+    assert len(JournalRegistry.get_all_journals()) == count
+    assert len(JournalRegistry.get_journal_dict()) == count
+    assert len(JournalRegistry.get_issn_list("all")) == count
@@ -0,0 +1,17 @@
+"""Tests for how the metadata collector splits years into CrossRef queries."""
+
+from cite_hustle.collectors.metadata import MetadataCollector
+
+
+def test_year_ranges_join_consecutive_years():
+    assert MetadataCollector._year_ranges([2003, 2001, 2002, 2005]) == [(2001, 2003), (2005, 2005)]
+
+
+def test_year_ranges_are_capped():
+    """A range is cached all-or-nothing, so long runs are split into bounded queries."""
+    cap = MetadataCollector.MAX_RANGE_YEARS
+    ranges = MetadataCollector._year_ranges(list(range(1990, 1990 + 2 * cap + 1)))
+
+    assert all(last - first + 1 <= cap for first, last in ranges)
+    assert ranges[0] == (1990, 1990 + cap - 1)
+    assert sum(last - first + 1 for first, last in ranges) == 2 * cap + 1